@@ -5,7 +5,9 @@ import { authorizeByRole } from "../middleware/auth.js";
 const router = express.Router();
 
 router.get("/auth", authorizeByRole([]), (req, res) => {
-  mediaClient.GetUploadAuth({}, (error, response) => {
+  const { folder, tags } = req.query;
+  const request = { folder, tags: tags ? [].concat(tags) : [] };
+  mediaClient.GetUploadAuth(request, (error, response) => {
     if (error) {
       return res.status(500).json({ error: error.message });
     }
@@ -22,6 +24,16 @@ router.post("/upload", authorizeByRole([]), (req, res) => {
   });
 });
 
+router.post("/commit", authorizeByRole([]), (req, res) => {
+  const { file_id } = req.body;
+  mediaClient.CommitUpload({ file_id }, (error, response) => {
+    if (error) {
+      return res.status(500).json({ error: error.message });
+    }
+    res.json(response);
+  });
+});
+
 router.get("/files", authorizeByRole(["admin"]), (req, res) => {
   const { limit, offset } = req.query;
   mediaClient.GetFiles({ limit, offset }, (error, response) => {
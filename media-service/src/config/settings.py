@@ -1,38 +1,83 @@
 """Configuration settings for the media service."""
 import os
-from typing import Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Any, Dict
 
+import msgspec
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+
+class Settings(msgspec.Struct, frozen=True, kw_only=True):
     """Application settings."""
     
     # ImageKit Configuration
-    imagekit_private_key: str = Field(..., alias="IK_PRIVATE_KEY")
-    imagekit_public_key: str = Field(..., alias="IK_PUBLIC_KEY")
-    imagekit_url_endpoint: str = Field(..., alias="IK_URL_ENDPOINT")
+    imagekit_private_key: str = msgspec.field(name="IK_PRIVATE_KEY")
+    imagekit_public_key: str = msgspec.field(name="IK_PUBLIC_KEY")
+    imagekit_url_endpoint: str = msgspec.field(name="IK_URL_ENDPOINT")
+    imagekit_pool_size: int = msgspec.field(default=32, name="IK_POOL_SIZE")  # kept-alive connections
+    imagekit_timeout: float = msgspec.field(default=30.0, name="IK_TIMEOUT")  # seconds
     
     # gRPC Server Configuration
-    grpc_port: int = Field(50056, env="GRPC_PORT")
-    grpc_host: str = Field("0.0.0.0", env="GRPC_HOST")
-    max_workers: int = Field(10, env="MAX_WORKERS")
+    grpc_port: int = msgspec.field(default=50056, name="GRPC_PORT")
+    grpc_host: str = msgspec.field(default="0.0.0.0", name="GRPC_HOST")
+    max_workers: int = msgspec.field(default=10, name="MAX_WORKERS")
+    server_mode: str = msgspec.field(default="aio", name="SERVER_MODE")  # aio or thread
     
     # Logging Configuration
-    log_level: str = Field("INFO", env="LOG_LEVEL")
-    log_format: str = Field("json", env="LOG_FORMAT")  # json or console
+    log_level: str = msgspec.field(default="INFO", name="LOG_LEVEL")
+    log_format: str = msgspec.field(default="json", name="LOG_FORMAT")  # json or console
+    log_sample_rate: float = msgspec.field(default=0.01, name="LOG_SAMPLE_RATE")  # share of routine info logs kept
+    metrics_port: int = msgspec.field(default=9090, name="METRICS_PORT")  # 0 disables the Prometheus endpoint
     
     # Application Configuration
-    app_name: str = Field("media-service", env="APP_NAME")
-    environment: str = Field("development", env="ENVIRONMENT")
+    app_name: str = msgspec.field(default="media-service", name="APP_NAME")
+    environment: str = msgspec.field(default="development", name="ENVIRONMENT")
     
     # Request limits
-    max_file_size_mb: int = Field(100, env="MAX_FILE_SIZE_MB")
-    max_files_per_batch_delete: int = Field(100, env="MAX_FILES_PER_BATCH_DELETE")
+    max_file_size_mb: int = msgspec.field(default=100, name="MAX_FILE_SIZE_MB")
+    # Larger files must be uploaded client-direct via GetUploadAuth + CommitUpload
+    max_server_upload_mb: int = msgspec.field(default=5, name="MAX_SERVER_UPLOAD_MB")
+    validate_file_types: bool = msgspec.field(default=True, name="VALIDATE_FILE_TYPES")  # reject unknown magic bytes
+    max_files_per_batch_delete: int = msgspec.field(default=1000, name="MAX_FILES_PER_BATCH_DELETE")
+    max_files_per_batch_details: int = msgspec.field(default=100, name="MAX_FILES_PER_BATCH_DETAILS")
+    
+    # Read cache Configuration
+    cache_ttl_seconds: float = msgspec.field(default=60.0, name="CACHE_TTL_SECONDS")
+    cache_max_entries: int = msgspec.field(default=10_000, name="CACHE_MAX_ENTRIES")
+    shared_cache_ttl_seconds: int = msgspec.field(default=300, name="SHARED_CACHE_TTL_SECONDS")  # Redis tier, needs REDIS_URL
+    
+    # Delete queue Configuration
+    redis_url: str = msgspec.field(default="", name="REDIS_URL")  # empty keeps delete jobs in memory
+    delete_workers: int = msgspec.field(default=16, name="DELETE_WORKERS")
+    delete_queue_max_pending: int = msgspec.field(default=1000, name="DELETE_QUEUE_MAX_PENDING")
+    delete_wait_timeout: float = msgspec.field(default=10.0, name="DELETE_WAIT_TIMEOUT")  # seconds
+
+
+# Environment variable names recognised by Settings
+_ENV_NAMES = frozenset(field.encode_name for field in msgspec.structs.fields(Settings))
+
+
+def load_settings(env_file: str = ".env") -> Settings:
+    """Build settings from the ``.env`` file and the environment (environment wins)."""
+    values: Dict[str, Any] = {}
+    for source in (dotenv_values(env_file, encoding="utf-8"), os.environ):
+        for key, value in source.items():
+            key = key.upper()
+            if key in _ENV_NAMES and value is not None:
+                values[key] = value
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Environment values are strings; strict=False coerces them to the field types
+    return msgspec.convert(values, Settings, strict=False)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process."""
+    return load_settings()
+
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``settings`` attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -24,53 +24,77 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bmedia.proto\x12\x05media\"\x16\n\x14GetUploadAuthRequest\"\x85\x01\n\x15GetUploadAuthResponse\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0e\n\x06\x65xpire\x18\x02 \x01(\x03\x12\x11\n\tsignature\x18\x03 \x01(\t\x12\x12\n\npublic_key\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rerror_message\x18\x06 \x01(\t\"(\n\x15GetFileDetailsRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\"b\n\x16GetFileDetailsResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\x81\x01\n\x0fGetFilesRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x14\n\x0csearch_query\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x11\n\tfile_type\x18\x05 \x01(\t\x12\x0c\n\x04sort\x18\x06 \x01(\t\x12\x0c\n\x04path\x18\x07 \x01(\t\"r\n\x10GetFilesResponse\x12!\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\"$\n\x11\x44\x65leteFileRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\"<\n\x12\x44\x65leteFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\".\n\x1a\x44\x65leteMultipleFilesRequest\x12\x10\n\x08\x66ile_ids\x18\x01 \x03(\t\"o\n\x1b\x44\x65leteMultipleFilesResponse\x12$\n\x07results\x18\x01 \x03(\x0b\x32\x13.media.DeleteResult\x12\x13\n\x0b\x61ll_success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\x8f\x01\n\x11UploadFileRequest\x12\x11\n\tfile_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0e\n\x06\x66older\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x1b\n\x13use_unique_filename\x18\x05 \x01(\x08\x12\x1a\n\x12\x63ustom_coordinates\x18\x06 \x01(\t\"^\n\x12UploadFileResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\xda\x01\n\x18UpdateFileDetailsRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\x1a\n\x12\x63ustom_coordinates\x18\x03 \x01(\t\x12L\n\x0f\x63ustom_metadata\x18\x04 \x03(\x0b\x32\x33.media.UpdateFileDetailsRequest.CustomMetadataEntry\x1a\x35\n\x13\x43ustomMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"e\n\x19UpdateFileDetailsResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\xd3\x02\n\x0b\x46ileDetails\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x15\n\rthumbnail_url\x18\x04 \x01(\t\x12\x0c\n\x04size\x18\x05 \x01(\x03\x12\x11\n\tfile_type\x18\x06 \x01(\t\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12\x13\n\x0b\x66older_path\x18\x08 \x01(\t\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t\x12\r\n\x05width\x18\x0b \x01(\x05\x12\x0e\n\x06height\x18\x0c \x01(\x05\x12?\n\x0f\x63ustom_metadata\x18\r \x03(\x0b\x32&.media.FileDetails.CustomMetadataEntry\x1a\x35\n\x13\x43ustomMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"G\n\x0c\x44\x65leteResult\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t2\xa2\x04\n\x0cMediaService\x12J\n\rGetUploadAuth\x12\x1b.media.GetUploadAuthRequest\x1a\x1c.media.GetUploadAuthResponse\x12M\n\x0eGetFileDetails\x12\x1c.media.GetFileDetailsRequest\x1a\x1d.media.GetFileDetailsResponse\x12;\n\x08GetFiles\x12\x16.media.GetFilesRequest\x1a\x17.media.GetFilesResponse\x12\x41\n\nDeleteFile\x12\x18.media.DeleteFileRequest\x1a\x19.media.DeleteFileResponse\x12\\\n\x13\x44\x65leteMultipleFiles\x12!.media.DeleteMultipleFilesRequest\x1a\".media.DeleteMultipleFilesResponse\x12\x41\n\nUploadFile\x12\x18.media.UploadFileRequest\x1a\x19.media.UploadFileResponse\x12V\n\x11UpdateFileDetails\x12\x1f.media.UpdateFileDetailsRequest\x1a .media.UpdateFileDetailsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bmedia.proto\x12\x05media\"4\n\x14GetUploadAuthRequest\x12\x0e\n\x06\x66older\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x03(\t\"\xb7\x01\n\x15GetUploadAuthResponse\x12\r\n\x05token\x18\x01 \x01(\t\x12\x0e\n\x06\x65xpire\x18\x02 \x01(\x03\x12\x11\n\tsignature\x18\x03 \x01(\t\x12\x12\n\npublic_key\x18\x04 \x01(\t\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rerror_message\x18\x06 \x01(\t\x12\x12\n\nupload_url\x18\x07 \x01(\t\x12\x0e\n\x06\x66older\x18\x08 \x01(\t\x12\x0c\n\x04tags\x18\t \x03(\t\"(\n\x15GetFileDetailsRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\"b\n\x16GetFileDetailsResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\".\n\x1aGetFileDetailsBatchRequest\x12\x10\n\x08\x66ile_ids\x18\x01 \x03(\t\"\xb4\x02\n\x1bGetFileDetailsBatchResponse\x12<\n\x05\x66iles\x18\x01 \x03(\x0b\x32-.media.GetFileDetailsBatchResponse.FilesEntry\x12>\n\x06\x65rrors\x18\x02 \x03(\x0b\x32..media.GetFileDetailsBatchResponse.ErrorsEntry\x12\x0f\n\x07success\x18\x03 \x01(\x08\x12\x15\n\rerror_message\x18\x04 \x01(\t\x1a@\n\nFilesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.media.FileDetails:\x02\x38\x01\x1a-\n\x0b\x45rrorsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x81\x01\n\x0fGetFilesRequest\x12\x0c\n\x04skip\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x14\n\x0csearch_query\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x11\n\tfile_type\x18\x05 \x01(\t\x12\x0c\n\x04sort\x18\x06 \x01(\t\x12\x0c\n\x04path\x18\x07 \x01(\t\"r\n\x10GetFilesResponse\x12!\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\"$\n\x11\x44\x65leteFileRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\"<\n\x12\x44\x65leteFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\"A\n\x1a\x44\x65leteMultipleFilesRequest\x12\x10\n\x08\x66ile_ids\x18\x01 \x03(\t\x12\x11\n\trun_async\x18\x02 \x01(\x08\"\x8f\x01\n\x1b\x44\x65leteMultipleFilesResponse\x12$\n\x07results\x18\x01 \x03(\x0b\x32\x13.media.DeleteResult\x12\x13\n\x0b\x61ll_success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\x12\x0e\n\x06job_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\"+\n\x19GetDeleteJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x9f\x01\n\x1aGetDeleteJobStatusResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12$\n\x07results\x18\x03 \x03(\x0b\x32\x13.media.DeleteResult\x12\x13\n\x0b\x61ll_success\x18\x04 \x01(\x08\x12\x0f\n\x07success\x18\x05 \x01(\x08\x12\x15\n\rerror_message\x18\x06 \x01(\t\"\x8f\x01\n\x11UploadFileRequest\x12\x11\n\tfile_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0e\n\x06\x66older\x18\x03 \x01(\t\x12\x0c\n\x04tags\x18\x04 \x03(\t\x12\x1b\n\x13use_unique_filename\x18\x05 \x01(\x08\x12\x1a\n\x12\x63ustom_coordinates\x18\x06 \x01(\t\"^\n\x12UploadFileResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"}\n\x12UploadFileMetadata\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x0e\n\x06\x66older\x18\x02 \x01(\t\x12\x0c\n\x04tags\x18\x03 \x03(\t\x12\x1b\n\x13use_unique_filename\x18\x04 \x01(\x08\x12\x1a\n\x12\x63ustom_coordinates\x18\x05 \x01(\t\"Y\n\x0fUploadFileChunk\x12-\n\x08metadata\x18\x01 \x01(\x0b\x32\x19.media.UploadFileMetadataH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"&\n\x13\x43ommitUploadRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\"`\n\x14\x43ommitUploadResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\xda\x01\n\x18UpdateFileDetailsRequest\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\x1a\n\x12\x63ustom_coordinates\x18\x03 \x01(\t\x12L\n\x0f\x63ustom_metadata\x18\x04 \x03(\x0b\x32\x33.media.UpdateFileDetailsRequest.CustomMetadataEntry\x1a\x35\n\x13\x43ustomMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"e\n\x19UpdateFileDetailsResponse\x12 \n\x04\x66ile\x18\x01 \x01(\x0b\x32\x12.media.FileDetails\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\xd3\x02\n\x0b\x46ileDetails\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x15\n\rthumbnail_url\x18\x04 \x01(\t\x12\x0c\n\x04size\x18\x05 \x01(\x03\x12\x11\n\tfile_type\x18\x06 \x01(\t\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12\x13\n\x0b\x66older_path\x18\x08 \x01(\t\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t\x12\r\n\x05width\x18\x0b \x01(\x05\x12\x0e\n\x06height\x18\x0c \x01(\x05\x12?\n\x0f\x63ustom_metadata\x18\r \x03(\x0b\x32&.media.FileDetails.CustomMetadataEntry\x1a\x35\n\x13\x43ustomMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"G\n\x0c\x44\x65leteResult\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t2\xaa\x07\n\x0cMediaService\x12J\n\rGetUploadAuth\x12\x1b.media.GetUploadAuthRequest\x1a\x1c.media.GetUploadAuthResponse\x12M\n\x0eGetFileDetails\x12\x1c.media.GetFileDetailsRequest\x1a\x1d.media.GetFileDetailsResponse\x12\\\n\x13GetFileDetailsBatch\x12!.media.GetFileDetailsBatchRequest\x1a\".media.GetFileDetailsBatchResponse\x12;\n\x08GetFiles\x12\x16.media.GetFilesRequest\x1a\x17.media.GetFilesResponse\x12;\n\x0bStreamFiles\x12\x16.media.GetFilesRequest\x1a\x12.media.FileDetails0\x01\x12\x41\n\nDeleteFile\x12\x18.media.DeleteFileRequest\x1a\x19.media.DeleteFileResponse\x12\\\n\x13\x44\x65leteMultipleFiles\x12!.media.DeleteMultipleFilesRequest\x1a\".media.DeleteMultipleFilesResponse\x12Y\n\x12GetDeleteJobStatus\x12 .media.GetDeleteJobStatusRequest\x1a!.media.GetDeleteJobStatusResponse\x12\x41\n\nUploadFile\x12\x18.media.UploadFileRequest\x1a\x19.media.UploadFileResponse\x12G\n\x10UploadFileStream\x12\x16.media.UploadFileChunk\x1a\x19.media.UploadFileResponse(\x01\x12G\n\x0c\x43ommitUpload\x12\x1a.media.CommitUploadRequest\x1a\x1b.media.CommitUploadResponse\x12V\n\x11UpdateFileDetails\x12\x1f.media.UpdateFileDetailsRequest\x1a .media.UpdateFileDetailsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'media_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_GETFILEDETAILSBATCHRESPONSE_FILESENTRY']._loaded_options = None
+  _globals['_GETFILEDETAILSBATCHRESPONSE_FILESENTRY']._serialized_options = b'8\001'
+  _globals['_GETFILEDETAILSBATCHRESPONSE_ERRORSENTRY']._loaded_options = None
+  _globals['_GETFILEDETAILSBATCHRESPONSE_ERRORSENTRY']._serialized_options = b'8\001'
   _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._loaded_options = None
   _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._serialized_options = b'8\001'
   _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._loaded_options = None
   _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._serialized_options = b'8\001'
   _globals['_GETUPLOADAUTHREQUEST']._serialized_start=22
-  _globals['_GETUPLOADAUTHREQUEST']._serialized_end=44
-  _globals['_GETUPLOADAUTHRESPONSE']._serialized_start=47
-  _globals['_GETUPLOADAUTHRESPONSE']._serialized_end=180
-  _globals['_GETFILEDETAILSREQUEST']._serialized_start=182
-  _globals['_GETFILEDETAILSREQUEST']._serialized_end=222
-  _globals['_GETFILEDETAILSRESPONSE']._serialized_start=224
-  _globals['_GETFILEDETAILSRESPONSE']._serialized_end=322
-  _globals['_GETFILESREQUEST']._serialized_start=325
-  _globals['_GETFILESREQUEST']._serialized_end=454
-  _globals['_GETFILESRESPONSE']._serialized_start=456
-  _globals['_GETFILESRESPONSE']._serialized_end=570
-  _globals['_DELETEFILEREQUEST']._serialized_start=572
-  _globals['_DELETEFILEREQUEST']._serialized_end=608
-  _globals['_DELETEFILERESPONSE']._serialized_start=610
-  _globals['_DELETEFILERESPONSE']._serialized_end=670
-  _globals['_DELETEMULTIPLEFILESREQUEST']._serialized_start=672
-  _globals['_DELETEMULTIPLEFILESREQUEST']._serialized_end=718
-  _globals['_DELETEMULTIPLEFILESRESPONSE']._serialized_start=720
-  _globals['_DELETEMULTIPLEFILESRESPONSE']._serialized_end=831
-  _globals['_UPLOADFILEREQUEST']._serialized_start=834
-  _globals['_UPLOADFILEREQUEST']._serialized_end=977
-  _globals['_UPLOADFILERESPONSE']._serialized_start=979
-  _globals['_UPLOADFILERESPONSE']._serialized_end=1073
-  _globals['_UPDATEFILEDETAILSREQUEST']._serialized_start=1076
-  _globals['_UPDATEFILEDETAILSREQUEST']._serialized_end=1294
-  _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._serialized_start=1241
-  _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._serialized_end=1294
-  _globals['_UPDATEFILEDETAILSRESPONSE']._serialized_start=1296
-  _globals['_UPDATEFILEDETAILSRESPONSE']._serialized_end=1397
-  _globals['_FILEDETAILS']._serialized_start=1400
-  _globals['_FILEDETAILS']._serialized_end=1739
-  _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._serialized_start=1241
-  _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._serialized_end=1294
-  _globals['_DELETERESULT']._serialized_start=1741
-  _globals['_DELETERESULT']._serialized_end=1812
-  _globals['_MEDIASERVICE']._serialized_start=1815
-  _globals['_MEDIASERVICE']._serialized_end=2361
+  _globals['_GETUPLOADAUTHREQUEST']._serialized_end=74
+  _globals['_GETUPLOADAUTHRESPONSE']._serialized_start=77
+  _globals['_GETUPLOADAUTHRESPONSE']._serialized_end=260
+  _globals['_GETFILEDETAILSREQUEST']._serialized_start=262
+  _globals['_GETFILEDETAILSREQUEST']._serialized_end=302
+  _globals['_GETFILEDETAILSRESPONSE']._serialized_start=304
+  _globals['_GETFILEDETAILSRESPONSE']._serialized_end=402
+  _globals['_GETFILEDETAILSBATCHREQUEST']._serialized_start=404
+  _globals['_GETFILEDETAILSBATCHREQUEST']._serialized_end=450
+  _globals['_GETFILEDETAILSBATCHRESPONSE']._serialized_start=453
+  _globals['_GETFILEDETAILSBATCHRESPONSE']._serialized_end=761
+  _globals['_GETFILEDETAILSBATCHRESPONSE_FILESENTRY']._serialized_start=650
+  _globals['_GETFILEDETAILSBATCHRESPONSE_FILESENTRY']._serialized_end=714
+  _globals['_GETFILEDETAILSBATCHRESPONSE_ERRORSENTRY']._serialized_start=716
+  _globals['_GETFILEDETAILSBATCHRESPONSE_ERRORSENTRY']._serialized_end=761
+  _globals['_GETFILESREQUEST']._serialized_start=764
+  _globals['_GETFILESREQUEST']._serialized_end=893
+  _globals['_GETFILESRESPONSE']._serialized_start=895
+  _globals['_GETFILESRESPONSE']._serialized_end=1009
+  _globals['_DELETEFILEREQUEST']._serialized_start=1011
+  _globals['_DELETEFILEREQUEST']._serialized_end=1047
+  _globals['_DELETEFILERESPONSE']._serialized_start=1049
+  _globals['_DELETEFILERESPONSE']._serialized_end=1109
+  _globals['_DELETEMULTIPLEFILESREQUEST']._serialized_start=1111
+  _globals['_DELETEMULTIPLEFILESREQUEST']._serialized_end=1176
+  _globals['_DELETEMULTIPLEFILESRESPONSE']._serialized_start=1179
+  _globals['_DELETEMULTIPLEFILESRESPONSE']._serialized_end=1322
+  _globals['_GETDELETEJOBSTATUSREQUEST']._serialized_start=1324
+  _globals['_GETDELETEJOBSTATUSREQUEST']._serialized_end=1367
+  _globals['_GETDELETEJOBSTATUSRESPONSE']._serialized_start=1370
+  _globals['_GETDELETEJOBSTATUSRESPONSE']._serialized_end=1529
+  _globals['_UPLOADFILEREQUEST']._serialized_start=1532
+  _globals['_UPLOADFILEREQUEST']._serialized_end=1675
+  _globals['_UPLOADFILERESPONSE']._serialized_start=1677
+  _globals['_UPLOADFILERESPONSE']._serialized_end=1771
+  _globals['_UPLOADFILEMETADATA']._serialized_start=1773
+  _globals['_UPLOADFILEMETADATA']._serialized_end=1898
+  _globals['_UPLOADFILECHUNK']._serialized_start=1900
+  _globals['_UPLOADFILECHUNK']._serialized_end=1989
+  _globals['_COMMITUPLOADREQUEST']._serialized_start=1991
+  _globals['_COMMITUPLOADREQUEST']._serialized_end=2029
+  _globals['_COMMITUPLOADRESPONSE']._serialized_start=2031
+  _globals['_COMMITUPLOADRESPONSE']._serialized_end=2127
+  _globals['_UPDATEFILEDETAILSREQUEST']._serialized_start=2130
+  _globals['_UPDATEFILEDETAILSREQUEST']._serialized_end=2348
+  _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._serialized_start=2295
+  _globals['_UPDATEFILEDETAILSREQUEST_CUSTOMMETADATAENTRY']._serialized_end=2348
+  _globals['_UPDATEFILEDETAILSRESPONSE']._serialized_start=2350
+  _globals['_UPDATEFILEDETAILSRESPONSE']._serialized_end=2451
+  _globals['_FILEDETAILS']._serialized_start=2454
+  _globals['_FILEDETAILS']._serialized_end=2793
+  _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._serialized_start=2295
+  _globals['_FILEDETAILS_CUSTOMMETADATAENTRY']._serialized_end=2348
+  _globals['_DELETERESULT']._serialized_start=2795
+  _globals['_DELETERESULT']._serialized_end=2866
+  _globals['_MEDIASERVICE']._serialized_start=2869
+  _globals['_MEDIASERVICE']._serialized_end=3807
 # @@protoc_insertion_point(module_scope)
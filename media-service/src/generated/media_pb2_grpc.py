@@ -45,11 +45,21 @@ class MediaServiceStub(object):
                 request_serializer=media__pb2.GetFileDetailsRequest.SerializeToString,
                 response_deserializer=media__pb2.GetFileDetailsResponse.FromString,
                 _registered_method=True)
+        self.GetFileDetailsBatch = channel.unary_unary(
+                '/media.MediaService/GetFileDetailsBatch',
+                request_serializer=media__pb2.GetFileDetailsBatchRequest.SerializeToString,
+                response_deserializer=media__pb2.GetFileDetailsBatchResponse.FromString,
+                _registered_method=True)
         self.GetFiles = channel.unary_unary(
                 '/media.MediaService/GetFiles',
                 request_serializer=media__pb2.GetFilesRequest.SerializeToString,
                 response_deserializer=media__pb2.GetFilesResponse.FromString,
                 _registered_method=True)
+        self.StreamFiles = channel.unary_stream(
+                '/media.MediaService/StreamFiles',
+                request_serializer=media__pb2.GetFilesRequest.SerializeToString,
+                response_deserializer=media__pb2.FileDetails.FromString,
+                _registered_method=True)
         self.DeleteFile = channel.unary_unary(
                 '/media.MediaService/DeleteFile',
                 request_serializer=media__pb2.DeleteFileRequest.SerializeToString,
@@ -60,11 +70,26 @@ class MediaServiceStub(object):
                 request_serializer=media__pb2.DeleteMultipleFilesRequest.SerializeToString,
                 response_deserializer=media__pb2.DeleteMultipleFilesResponse.FromString,
                 _registered_method=True)
+        self.GetDeleteJobStatus = channel.unary_unary(
+                '/media.MediaService/GetDeleteJobStatus',
+                request_serializer=media__pb2.GetDeleteJobStatusRequest.SerializeToString,
+                response_deserializer=media__pb2.GetDeleteJobStatusResponse.FromString,
+                _registered_method=True)
         self.UploadFile = channel.unary_unary(
                 '/media.MediaService/UploadFile',
                 request_serializer=media__pb2.UploadFileRequest.SerializeToString,
                 response_deserializer=media__pb2.UploadFileResponse.FromString,
                 _registered_method=True)
+        self.UploadFileStream = channel.stream_unary(
+                '/media.MediaService/UploadFileStream',
+                request_serializer=media__pb2.UploadFileChunk.SerializeToString,
+                response_deserializer=media__pb2.UploadFileResponse.FromString,
+                _registered_method=True)
+        self.CommitUpload = channel.unary_unary(
+                '/media.MediaService/CommitUpload',
+                request_serializer=media__pb2.CommitUploadRequest.SerializeToString,
+                response_deserializer=media__pb2.CommitUploadResponse.FromString,
+                _registered_method=True)
         self.UpdateFileDetails = channel.unary_unary(
                 '/media.MediaService/UpdateFileDetails',
                 request_serializer=media__pb2.UpdateFileDetailsRequest.SerializeToString,
@@ -90,6 +115,13 @@ class MediaServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFileDetailsBatch(self, request, context):
+        """Get details of several files in one call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetFiles(self, request, context):
         """Get list of files with optional filters
         """
@@ -97,6 +129,13 @@ class MediaServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamFiles(self, request, context):
+        """Stream files matching the filters, fetching pages while earlier ones are sent
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteFile(self, request, context):
         """Delete a single file
         """
@@ -111,8 +150,29 @@ class MediaServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetDeleteJobStatus(self, request, context):
+        """Get the status of a queued delete job
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UploadFile(self, request, context):
-        """Upload file
+        """Upload file (small, server-side uploads only)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UploadFileStream(self, request_iterator, context):
+        """Upload file streamed as a metadata message followed by data chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CommitUpload(self, request, context):
+        """Confirm a client-direct upload landed and return its details
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -138,11 +198,21 @@ def add_MediaServiceServicer_to_server(servicer, server):
                     request_deserializer=media__pb2.GetFileDetailsRequest.FromString,
                     response_serializer=media__pb2.GetFileDetailsResponse.SerializeToString,
             ),
+            'GetFileDetailsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFileDetailsBatch,
+                    request_deserializer=media__pb2.GetFileDetailsBatchRequest.FromString,
+                    response_serializer=media__pb2.GetFileDetailsBatchResponse.SerializeToString,
+            ),
             'GetFiles': grpc.unary_unary_rpc_method_handler(
                     servicer.GetFiles,
                     request_deserializer=media__pb2.GetFilesRequest.FromString,
                     response_serializer=media__pb2.GetFilesResponse.SerializeToString,
             ),
+            'StreamFiles': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamFiles,
+                    request_deserializer=media__pb2.GetFilesRequest.FromString,
+                    response_serializer=media__pb2.FileDetails.SerializeToString,
+            ),
             'DeleteFile': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteFile,
                     request_deserializer=media__pb2.DeleteFileRequest.FromString,
@@ -153,11 +223,26 @@ def add_MediaServiceServicer_to_server(servicer, server):
                     request_deserializer=media__pb2.DeleteMultipleFilesRequest.FromString,
                     response_serializer=media__pb2.DeleteMultipleFilesResponse.SerializeToString,
             ),
+            'GetDeleteJobStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDeleteJobStatus,
+                    request_deserializer=media__pb2.GetDeleteJobStatusRequest.FromString,
+                    response_serializer=media__pb2.GetDeleteJobStatusResponse.SerializeToString,
+            ),
             'UploadFile': grpc.unary_unary_rpc_method_handler(
                     servicer.UploadFile,
                     request_deserializer=media__pb2.UploadFileRequest.FromString,
                     response_serializer=media__pb2.UploadFileResponse.SerializeToString,
             ),
+            'UploadFileStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadFileStream,
+                    request_deserializer=media__pb2.UploadFileChunk.FromString,
+                    response_serializer=media__pb2.UploadFileResponse.SerializeToString,
+            ),
+            'CommitUpload': grpc.unary_unary_rpc_method_handler(
+                    servicer.CommitUpload,
+                    request_deserializer=media__pb2.CommitUploadRequest.FromString,
+                    response_serializer=media__pb2.CommitUploadResponse.SerializeToString,
+            ),
             'UpdateFileDetails': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateFileDetails,
                     request_deserializer=media__pb2.UpdateFileDetailsRequest.FromString,
@@ -229,6 +314,33 @@ class MediaService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetFileDetailsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/media.MediaService/GetFileDetailsBatch',
+            media__pb2.GetFileDetailsBatchRequest.SerializeToString,
+            media__pb2.GetFileDetailsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetFiles(request,
             target,
@@ -256,6 +368,33 @@ class MediaService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamFiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/media.MediaService/StreamFiles',
+            media__pb2.GetFilesRequest.SerializeToString,
+            media__pb2.FileDetails.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteFile(request,
             target,
@@ -310,6 +449,33 @@ class MediaService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetDeleteJobStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/media.MediaService/GetDeleteJobStatus',
+            media__pb2.GetDeleteJobStatusRequest.SerializeToString,
+            media__pb2.GetDeleteJobStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UploadFile(request,
             target,
@@ -337,6 +503,60 @@ class MediaService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def UploadFileStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/media.MediaService/UploadFileStream',
+            media__pb2.UploadFileChunk.SerializeToString,
+            media__pb2.UploadFileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CommitUpload(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/media.MediaService/CommitUpload',
+            media__pb2.CommitUploadRequest.SerializeToString,
+            media__pb2.CommitUploadResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UpdateFileDetails(request,
             target,
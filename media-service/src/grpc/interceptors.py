@@ -1,175 +1,339 @@
-"""gRPC server interceptors for logging and error handling."""
+"""gRPC server interceptors for logging, error handling and metrics."""
+import logging
+import random
+import sys
+import threading
 import time
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Tuple
 import grpc
+from prometheus_client import Counter, Histogram, start_http_server
 
+from src.config.settings import get_settings
 from src.utils.logger import get_logger
 
+settings = get_settings()
 
-class LoggingInterceptor(grpc.ServerInterceptor):
-    """Interceptor for logging gRPC requests and responses."""
+_OK = grpc.StatusCode.OK
+_INTERNAL = grpc.StatusCode.INTERNAL
+
+# Prometheus metrics, scraped out-of-band instead of aggregated on the request path
+RPC_COUNT = Counter(
+    "grpc_requests_total",
+    "Total gRPC requests handled by the media service",
+    ["method", "status"]
+)
+RPC_LATENCY = Histogram(
+    "grpc_request_duration_seconds",
+    "gRPC request duration in seconds",
+    ["method"]
+)
+
+_metrics_server_lock = threading.Lock()
+_metrics_server_started = False
+
+# Fully-qualified method -> short method name; only registered methods are cached
+_METHOD_NAMES: Dict[str, str] = {}
+
+
+def register_service_methods(service_descriptor) -> None:
+    """Precompute interned short names for every method of a registered service."""
+    for method in service_descriptor.methods:
+        full_method = sys.intern(f"/{service_descriptor.full_name}/{method.name}")
+        _METHOD_NAMES[full_method] = sys.intern(method.name)
+
+
+def _method_name(full_method: str) -> str:
+    """Return the short name of a '/package.Service/Method' string."""
+    method_name = _METHOD_NAMES.get(full_method)
+    if method_name is None:
+        method_name = _METHOD_NAMES[full_method] = full_method.rpartition('/')[2]
+    return method_name
+
+
+def start_metrics_server(port: int) -> bool:
+    """Serve Prometheus metrics on ``port`` from a daemon thread, once per process."""
+    global _metrics_server_started
+    with _metrics_server_lock:
+        if _metrics_server_started or not port:
+            return False
+        start_http_server(port)
+        _metrics_server_started = True
+        return True
+
+
+def _select_behavior(handler: grpc.RpcMethodHandler) -> Tuple[Callable, Callable]:
+    """Pick the behavior and handler factory matching the RPC's cardinality."""
+    if handler.request_streaming and handler.response_streaming:
+        return handler.stream_stream, grpc.stream_stream_rpc_method_handler
+    if handler.request_streaming:
+        return handler.stream_unary, grpc.stream_unary_rpc_method_handler
+    if handler.response_streaming:
+        return handler.unary_stream, grpc.unary_stream_rpc_method_handler
+    return handler.unary_unary, grpc.unary_unary_rpc_method_handler
+
+
+def _unary_wrapper(behavior: Callable, hooks: Tuple[Callable, Callable, Callable, Callable, Callable]) -> Callable:
+    """Wrap a unary-response behavior with the observability hooks."""
+    on_start, on_success, on_error, on_cancel, on_finish = hooks
     
-    def __init__(self):
-        self.logger = get_logger("gRPC.LoggingInterceptor")
+    def new_behavior(request_or_iterator, context):
+        call = on_start()
+        try:
+            # Call the actual method
+            response = behavior(request_or_iterator, context)
+            on_success(context, call)
+            return response
+        except Exception as e:
+            on_error(e, context, call)
+            raise
+        except BaseException:
+            # Cancelled calls raise GeneratorExit or asyncio.CancelledError
+            on_cancel(call)
+            raise
+        finally:
+            on_finish(call)
     
-    def intercept_service(self, continuation: Callable, handler_call_details: grpc.HandlerCallDetails):
-        """Intercept and log gRPC service calls."""
-        method_name = handler_call_details.method.split('/')[-1]
-        start_time = time.time()
+    return new_behavior
+
+
+def _streaming_wrapper(behavior: Callable, hooks: Tuple[Callable, Callable, Callable, Callable, Callable]) -> Callable:
+    """Wrap a streaming-response behavior with the observability hooks."""
+    on_start, on_success, on_error, on_cancel, on_finish = hooks
+    
+    def new_behavior(request_or_iterator, context):
+        # Time the full response stream, not just the generator creation
+        call = on_start()
+        try:
+            yield from behavior(request_or_iterator, context)
+            on_success(context, call)
+        except Exception as e:
+            on_error(e, context, call)
+            raise
+        except BaseException:
+            # Cancelled calls raise GeneratorExit or asyncio.CancelledError
+            on_cancel(call)
+            raise
+        finally:
+            on_finish(call)
+    
+    return new_behavior
+
+
+def _async_unary_wrapper(behavior: Callable, hooks: Tuple[Callable, Callable, Callable, Callable, Callable]) -> Callable:
+    """Wrap a unary-response coroutine with the observability hooks."""
+    on_start, on_success, on_error, on_cancel, on_finish = hooks
+    
+    async def new_behavior(request_or_iterator, context):
+        call = on_start()
+        try:
+            # Await the actual method
+            response = await behavior(request_or_iterator, context)
+            on_success(context, call)
+            return response
+        except Exception as e:
+            on_error(e, context, call)
+            raise
+        except BaseException:
+            # Cancelled calls raise GeneratorExit or asyncio.CancelledError
+            on_cancel(call)
+            raise
+        finally:
+            on_finish(call)
+    
+    return new_behavior
+
+
+def _async_streaming_wrapper(behavior: Callable, hooks: Tuple[Callable, Callable, Callable, Callable, Callable]) -> Callable:
+    """Wrap a streaming-response async generator with the observability hooks."""
+    on_start, on_success, on_error, on_cancel, on_finish = hooks
+    
+    async def new_behavior(request_or_iterator, context):
+        # Time the full response stream, not just the generator creation
+        call = on_start()
+        try:
+            async for response in behavior(request_or_iterator, context):
+                yield response
+            on_success(context, call)
+        except Exception as e:
+            on_error(e, context, call)
+            raise
+        except BaseException:
+            # Cancelled calls raise GeneratorExit or asyncio.CancelledError
+            on_cancel(call)
+            raise
+        finally:
+            on_finish(call)
+    
+    return new_behavior
+
+
+class _ObservabilityBase:
+    """Shared logging, error handling and metrics for the sync and asyncio interceptors."""
+    
+    def __init__(self):
+        self.logger = get_logger(f"gRPC.{self.__class__.__name__}")
+        # Resolved again in start(), once logging has been configured
+        self._info_enabled = True
         
-        # Log request start
-        self.logger.info(
-            "gRPC request started",
-            method=method_name,
-            full_method=handler_call_details.method
-        )
+        # Wrapped handlers keyed by full method; gRPC registers handlers once at startup
+        self._handler_cache: Dict[str, grpc.RpcMethodHandler] = {}
+        self._handler_cache_lock = threading.Lock()
+    
+    def start(self):
+        """Pick up the configured log level before the server takes traffic."""
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
+        with self._handler_cache_lock:
+            # Rebuild wrappers so they pick up the current log level
+            self._handler_cache.clear()
+    
+    def _call_hooks(self, method_name: str, full_method: str) -> Tuple[Callable, Callable, Callable, Callable, Callable]:
+        """Build the start/success/error/cancel/finish hooks for one method."""
+        # Bind the per-method log context and hot-path lookups once so the
+        # hooks only touch closure locals
+        log = self.logger.bind(method=method_name, full_method=full_method)
+        log_info = log.info
+        log_error = log.error
+        info_enabled = self._info_enabled
+        # Routine request logs are sampled; failures are always logged
+        sample_rate = settings.log_sample_rate
+        sampled = (lambda: True) if sample_rate >= 1.0 else (lambda: random.random() < sample_rate)
+        now = time.monotonic_ns
+        count_success = RPC_COUNT.labels(method_name, "success").inc
+        count_error = RPC_COUNT.labels(method_name, "error").inc
+        count_cancelled = RPC_COUNT.labels(method_name, "cancelled").inc
+        observe_latency = RPC_LATENCY.labels(method_name).observe
         
-        # Get the original handler
-        handler = continuation(handler_call_details)
-        if handler is None:
-            return None
+        def on_start():
+            # Sample once per call so a logged call gets both its lines
+            logged = info_enabled and sampled()
+            
+            # Log request start
+            if logged:
+                log_info("gRPC request started", sample_rate=sample_rate)
+            
+            return now(), logged
         
-        def logging_wrapper(request, context):
-            try:
-                # Call the actual method
-                response = handler.unary_unary(request, context)
-                
-                # Log successful completion
-                duration = time.time() - start_time
-                self.logger.info(
+        def on_success(context, call):
+            start_ns, logged = call
+            # Servicers report failures with context.set_code() and return normally
+            code = context.code()
+            if code is not None and code is not _OK:
+                count_error()
+                log_error(
+                    "gRPC request failed",
+                    duration_ms=(now() - start_ns) // 1_000_000,
+                    status=code.name
+                )
+                return
+            
+            count_success()
+            
+            # Log successful completion
+            if logged:
+                log_info(
                     "gRPC request completed",
-                    method=method_name,
-                    duration_ms=round(duration * 1000, 2),
-                    status="SUCCESS"
+                    duration_ms=(now() - start_ns) // 1_000_000,
+                    status="SUCCESS",
+                    sample_rate=sample_rate
                 )
-                
-                return response
-                
-            except Exception as e:
-                # Log error
-                duration = time.time() - start_time
-                self.logger.error(
+        
+        def on_error(e, context, call):
+            start_ns = call[0]
+            count_error()
+            
+            if isinstance(e, grpc.RpcError):
+                # Log and re-raise gRPC errors as-is
+                log_error(
                     "gRPC request failed",
-                    method=method_name,
-                    duration_ms=round(duration * 1000, 2),
+                    duration_ms=(now() - start_ns) // 1_000_000,
                     error=str(e),
                     status="ERROR"
                 )
-                raise
+                return
+            
+            # Handle unexpected errors
+            log_error(
+                "gRPC request failed",
+                duration_ms=(now() - start_ns) // 1_000_000,
+                error=str(e),
+                error_type=type(e).__name__,
+                status="ERROR"
+            )
+            
+            # Set appropriate gRPC error
+            context.set_code(_INTERNAL)
+            context.set_details(f"Internal server error: {str(e)}")
         
-        # Return a new handler with the wrapped function
-        return grpc.unary_unary_rpc_method_handler(
-            logging_wrapper,
-            request_deserializer=handler.request_deserializer,
-            response_serializer=handler.response_serializer
-        )
+        def on_cancel(call):
+            count_cancelled()
+        
+        def on_finish(call):
+            start_ns = call[0]
+            observe_latency((now() - start_ns) / 1_000_000_000)
+        
+        return on_start, on_success, on_error, on_cancel, on_finish
+    
+    def _wrap_handler(
+        self,
+        handler: grpc.RpcMethodHandler,
+        full_method: str,
+        unary_wrapper: Callable,
+        streaming_wrapper: Callable,
+    ) -> grpc.RpcMethodHandler:
+        """Wrap a method handler once and reuse the wrapped handler for later calls."""
+        with self._handler_cache_lock:
+            wrapped = self._handler_cache.get(full_method)
+            if wrapped is None:
+                behavior, handler_factory = _select_behavior(handler)
+                wrapper = streaming_wrapper if handler.response_streaming else unary_wrapper
+                hooks = self._call_hooks(_method_name(full_method), full_method)
+                wrapped = self._handler_cache[full_method] = handler_factory(
+                    wrapper(behavior, hooks),
+                    request_deserializer=handler.request_deserializer,
+                    response_serializer=handler.response_serializer
+                )
+        return wrapped
 
 
-class ErrorHandlingInterceptor(grpc.ServerInterceptor):
-    """Interceptor for consistent error handling across gRPC methods."""
-    
-    def __init__(self):
-        self.logger = get_logger("gRPC.ErrorHandlingInterceptor")
+class ObservabilityInterceptor(_ObservabilityBase, grpc.ServerInterceptor):
+    """Interceptor for logging, error handling and metrics in a single wrapper."""
     
     def intercept_service(self, continuation: Callable, handler_call_details: grpc.HandlerCallDetails):
-        """Intercept and handle gRPC service errors."""
+        """Intercept gRPC service calls to log, translate errors and collect metrics."""
+        cached = self._handler_cache.get(handler_call_details.method)
+        if cached is not None:
+            return cached
         
-        # Get the original handler
+        # Get the original handler; unknown methods pass through untouched
         handler = continuation(handler_call_details)
         if handler is None:
             return None
         
-        def error_handling_wrapper(request, context):
-            try:
-                return handler.unary_unary(request, context)
-                
-            except grpc.RpcError:
-                # Re-raise gRPC errors as-is
-                raise
-                
-            except Exception as e:
-                # Handle unexpected errors
-                method_name = handler_call_details.method.split('/')[-1]
-                self.logger.error(
-                    "Unhandled error in gRPC method",
-                    method=method_name,
-                    error=str(e),
-                    error_type=type(e).__name__
-                )
-                
-                # Set appropriate gRPC error
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(f"Internal server error: {str(e)}")
-                
-                # Return empty response or raise based on method expectations
-                raise
-        
-        # Return a new handler with the wrapped function
-        return grpc.unary_unary_rpc_method_handler(
-            error_handling_wrapper,
-            request_deserializer=handler.request_deserializer,
-            response_serializer=handler.response_serializer
+        return self._wrap_handler(
+            handler, handler_call_details.method, _unary_wrapper, _streaming_wrapper
         )
 
 
-class MetricsInterceptor(grpc.ServerInterceptor):
-    """Interceptor for collecting metrics (optional, for production monitoring)."""
-    
-    def __init__(self):
-        self.logger = get_logger("gRPC.MetricsInterceptor")
-        self.request_count = {}
-        self.request_duration = {}
+class AsyncObservabilityInterceptor(_ObservabilityBase, grpc.aio.ServerInterceptor):
+    """asyncio counterpart of ObservabilityInterceptor for grpc.aio servers."""
     
-    def intercept_service(self, continuation: Callable, handler_call_details: grpc.HandlerCallDetails):
-        """Intercept and collect metrics for gRPC service calls."""
-        method_name = handler_call_details.method.split('/')[-1]
+    async def intercept_service(self, continuation: Callable, handler_call_details: grpc.HandlerCallDetails):
+        """Intercept gRPC service calls to log, translate errors and collect metrics."""
+        cached = self._handler_cache.get(handler_call_details.method)
+        if cached is not None:
+            return cached
         
-        # Get the original handler
-        handler = continuation(handler_call_details)
+        # Get the original handler; unknown methods pass through untouched
+        handler = await continuation(handler_call_details)
         if handler is None:
             return None
         
-        def metrics_wrapper(request, context):
-            start_time = time.time()
-            
-            # Initialize counters
-            if method_name not in self.request_count:
-                self.request_count[method_name] = 0
-                self.request_duration[method_name] = []
-            
-            self.request_count[method_name] += 1
-            
-            try:
-                response = handler.unary_unary(request, context)
-                status = "success"
-                return response
-                
-            except Exception as e:
-                status = "error"
-                raise
-                
-            finally:
-                # Record duration
-                duration = time.time() - start_time
-                self.request_duration[method_name].append(duration)
-                
-                # Log metrics periodically (every 100 requests)
-                if self.request_count[method_name] % 100 == 0:
-                    avg_duration = sum(self.request_duration[method_name]) / len(self.request_duration[method_name])
-                    self.logger.info(
-                        "Method metrics",
-                        method=method_name,
-                        total_requests=self.request_count[method_name],
-                        avg_duration_ms=round(avg_duration * 1000, 2)
-                    )
-                    
-                    # Keep only last 1000 durations to prevent memory growth
-                    if len(self.request_duration[method_name]) > 1000:
-                        self.request_duration[method_name] = self.request_duration[method_name][-1000:]
-        
-        # Return a new handler with the wrapped function
-        return grpc.unary_unary_rpc_method_handler(
-            metrics_wrapper,
-            request_deserializer=handler.request_deserializer,
-            response_serializer=handler.response_serializer
-        )
\ No newline at end of file
+        return self._wrap_handler(
+            handler, handler_call_details.method, _async_unary_wrapper, _async_streaming_wrapper
+        )
+
+
+# Process-wide interceptor instances, so metrics and logger setup are shared
+# by every server created in this process
+OBSERVABILITY_INTERCEPTOR = ObservabilityInterceptor()
+ASYNC_OBSERVABILITY_INTERCEPTOR = AsyncObservabilityInterceptor()
\ No newline at end of file
@@ -1,16 +1,26 @@
 """gRPC server implementation for the media service."""
+import asyncio
 import signal
 import sys
+import threading
 from concurrent import futures
+from typing import Optional
 import grpc
-from grpc_reflection.v1alpha import reflection
+from google.protobuf.internal import api_implementation
 
 from src.generated import media_pb2, media_pb2_grpc
-from src.services.media_service import MediaServiceImpl
-from src.grpc.interceptors import LoggingInterceptor, ErrorHandlingInterceptor
-from src.config.settings import settings
+from src.services.media_service import MediaServiceImpl, AsyncMediaServiceImpl
+from src.grpc.interceptors import (
+    OBSERVABILITY_INTERCEPTOR,
+    ASYNC_OBSERVABILITY_INTERCEPTOR,
+    register_service_methods,
+    start_metrics_server,
+)
+from src.config.settings import get_settings
 from src.utils.logger import configure_logging, get_logger
 
+settings = get_settings()
+
 
 class MediaServiceServer:
     """Production-ready gRPC server for media service."""
@@ -18,32 +28,51 @@ class MediaServiceServer:
     def __init__(self):
         self.logger = get_logger("MediaServiceServer")
         self.server = None
+        self.interceptor = None
         
+    def _server_options(self) -> list:
+        """Channel options shared by the thread-pool and asyncio servers."""
+        return [
+            ('grpc.keepalive_time_ms', 30000),
+            ('grpc.keepalive_timeout_ms', 5000),
+            ('grpc.keepalive_permit_without_calls', True),
+            ('grpc.http2.max_pings_without_data', 0),
+            ('grpc.http2.min_time_between_pings_ms', 10000),
+            ('grpc.http2.min_ping_interval_without_data_ms', 300000),
+            # gRPC core has no shared write buffer option, so an idle
+            # connection keeps its transport buffers until it is closed;
+            # reclaim them after one minute without RPCs
+            ('grpc.max_connection_idle_ms', 60000),
+            ('grpc.max_connection_age_ms', 300000),
+            ('grpc.max_connection_age_grace_ms', 30000),
+            # Server-wide ceilings: servers ignore per-method service config.
+            # The largest request is a unary UploadFile, so anything bigger is
+            # rejected by the transport before it is buffered; streamed
+            # uploads arrive in smaller chunks. Responses carry file
+            # metadata only, never file content
+            ('grpc.max_receive_message_length', (settings.max_server_upload_mb + 1) * 1024 * 1024),
+            ('grpc.max_send_message_length', 10 * 1024 * 1024),      # 10MB
+            ('grpc.http2.lookahead_bytes', 64 * 1024),               # 64KB
+            ('grpc.max_concurrent_streams', 1000),
+            ('grpc.so_reuseport', 1),
+            ('grpc.optimization_target', 'throughput'),
+            ('grpc.experimental.tcp_read_chunk_size', 8 * 1024 * 1024),       # 8MB
+            ('grpc.experimental.tcp_max_read_chunk_size', 16 * 1024 * 1024),  # 16MB
+        ]
+    
     def create_server(self) -> grpc.Server:
-        """Create and configure the gRPC server."""
+        """Create and configure the thread-pool gRPC server."""
         # Create interceptors
+        self.interceptor = OBSERVABILITY_INTERCEPTOR
         interceptors = [
-            LoggingInterceptor(),
-            ErrorHandlingInterceptor(),
+            self.interceptor,
         ]
         
         # Create server with thread pool
         server = grpc.server(
             futures.ThreadPoolExecutor(max_workers=settings.max_workers),
             interceptors=interceptors,
-            options=[
-                ('grpc.keepalive_time_ms', 30000),
-                ('grpc.keepalive_timeout_ms', 5000),
-                ('grpc.keepalive_permit_without_calls', True),
-                ('grpc.http2.max_pings_without_data', 0),
-                ('grpc.http2.min_time_between_pings_ms', 10000),
-                ('grpc.http2.min_ping_interval_without_data_ms', 300000),
-                ('grpc.max_connection_idle_ms', 300000),
-                ('grpc.max_connection_age_ms', 300000),
-                ('grpc.max_connection_age_grace_ms', 30000),
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024),  # 100MB
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),     # 100MB
-            ]
+            options=self._server_options()
         )
         
         # Add MediaService
@@ -51,10 +80,44 @@ class MediaServiceServer:
             MediaServiceImpl(), server
         )
         
+        return self._configure_server(server)
+    
+    def create_server_async(self) -> grpc.aio.Server:
+        """Create and configure the asyncio gRPC server."""
+        # Create interceptors
+        self.interceptor = ASYNC_OBSERVABILITY_INTERCEPTOR
+        interceptors = [
+            self.interceptor,
+        ]
+        
+        server = grpc.aio.server(
+            interceptors=interceptors,
+            options=self._server_options()
+        )
+        
+        # Add MediaService; blocking ImageKit calls run on a bounded executor
+        media_pb2_grpc.add_MediaServiceServicer_to_server(
+            AsyncMediaServiceImpl(
+                executor=futures.ThreadPoolExecutor(max_workers=settings.max_workers)
+            ),
+            server
+        )
+        
+        return self._configure_server(server)
+    
+    def _configure_server(self, server):
+        """Enable reflection and bind the listen address on a new server."""
+        service_descriptor = media_pb2.DESCRIPTOR.services_by_name['MediaService']
+        # Resolve method names once here rather than on the first call of each RPC
+        register_service_methods(service_descriptor)
+        
         # Enable reflection for development
         if settings.environment == "development":
+            # Imported here so other environments skip loading reflection
+            from grpc_reflection.v1alpha import reflection
+            
             SERVICE_NAMES = (
-                media_pb2.DESCRIPTOR.services_by_name['MediaService'].full_name,
+                service_descriptor.full_name,
                 reflection.SERVICE_NAME,
             )
             reflection.enable_server_reflection(SERVICE_NAMES, server)
@@ -68,15 +131,23 @@ class MediaServiceServer:
             "gRPC server configured",
             address=listen_addr,
             max_workers=settings.max_workers,
+            server_mode=settings.server_mode,
             environment=settings.environment
         )
         
         return server
     
+    def _start_metrics_server(self):
+        """Expose Prometheus metrics for scraping."""
+        if start_metrics_server(settings.metrics_port):
+            self.logger.info("Metrics server started", port=settings.metrics_port)
+    
     def start(self):
         """Start the gRPC server."""
         self.server = self.create_server()
         self.server.start()
+        self.interceptor.start()
+        self._start_metrics_server()
         
         self.logger.info(
             "Media service started",
@@ -94,17 +165,61 @@ class MediaServiceServer:
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
         
-    def stop(self, grace_period: int = 30):
-        """Stop the gRPC server gracefully."""
-        if self.server:
-            self.logger.info("Shutting down server", grace_period=grace_period)
-            self.server.stop(grace_period)
+    def stop(self, grace_period: int = 30) -> Optional[threading.Event]:
+        """Stop the gRPC server gracefully, waiting for in-flight RPCs to drain."""
+        if not self.server:
+            return None
+        
+        self.logger.info("Shutting down server", grace_period=grace_period)
+        event = self.server.stop(grace_period)
+        # Block until draining completes, with a hard deadline past the grace period
+        if event.wait(timeout=grace_period + 5):
             self.logger.info("Server shutdown complete")
+        else:
+            self.logger.warning("Server shutdown timed out", grace_period=grace_period)
+        return event
     
     def wait_for_termination(self):
         """Wait for server termination."""
         if self.server:
             self.server.wait_for_termination()
+    
+    async def start_async(self):
+        """Start the asyncio gRPC server."""
+        self.server = self.create_server_async()
+        await self.server.start()
+        self.interceptor.start()
+        self._start_metrics_server()
+        
+        self.logger.info(
+            "Media service started",
+            host=settings.grpc_host,
+            port=settings.grpc_port,
+            environment=settings.environment
+        )
+        
+        # Setup signal handlers for graceful shutdown
+        loop = asyncio.get_running_loop()
+        
+        def signal_handler(signum):
+            self.logger.info("Received shutdown signal", signal=signum)
+            loop.create_task(self.stop_async())
+        
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, signal_handler, signum)
+    
+    async def stop_async(self, grace_period: int = 30):
+        """Stop the asyncio gRPC server gracefully."""
+        if self.server:
+            self.logger.info("Shutting down server", grace_period=grace_period)
+            await self.server.stop(grace_period)
+            self.logger.info("Server shutdown complete")
+    
+    async def serve_async(self):
+        """Start the asyncio server and wait until it terminates."""
+        await self.start_async()
+        self.logger.info("Server ready to accept connections")
+        await self.server.wait_for_termination()
 
 
 def main():
@@ -117,11 +232,22 @@ def main():
         "Starting media service",
         version="1.0.0",
         environment=settings.environment,
-        imagekit_endpoint=settings.imagekit_url_endpoint
+        imagekit_endpoint=settings.imagekit_url_endpoint,
+        protobuf_implementation=api_implementation.Type()
     )
+    if api_implementation.Type() == "python":
+        logger.warning("Using the pure-Python protobuf runtime; message encoding will be slow")
     
     # Create and start server
     server = MediaServiceServer()
+    if settings.server_mode == "aio":
+        try:
+            asyncio.run(server.serve_async())
+        except Exception as e:
+            logger.error("Server error", error=str(e))
+            sys.exit(1)
+        return
+    
     try:
         server.start()
         logger.info("Server ready to accept connections")
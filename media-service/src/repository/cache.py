@@ -0,0 +1,185 @@
+"""Read caches for ImageKit metadata: a per-process TTL cache and a shared Redis tier."""
+import hashlib
+import threading
+from concurrent import futures
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import redis
+from cachetools import TTLCache
+
+from src.generated import media_pb2
+from src.utils.logger import LoggerMixin
+
+
+class CoalescingTTLCache:
+    """LRU + TTL cache that lets one caller fetch a missing key while others wait.
+    
+    Every invalidation bumps a generation counter; a fetch that started before
+    an invalidation still answers its callers but is not stored, so writes
+    never leave stale entries behind.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: Dict[Hashable, futures.Future] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+    
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return ``(value, cache_hit)`` for ``key``, calling ``loader`` at most once per miss."""
+        with self._lock:
+            try:
+                return self._cache[key], True
+            except KeyError:
+                pass
+            
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = futures.Future()
+                self._in_flight[key] = future
+                generation = self._generation
+        
+        if not leader:
+            # Coalesced onto an identical in-flight request
+            return future.result(), True
+        
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if generation == self._generation:
+                self._cache[key] = value
+        future.set_result(value)
+        return value, False
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for ``key``, or None without loading it."""
+        with self._lock:
+            return self._cache.get(key)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry."""
+        with self._lock:
+            self._generation += 1
+            self._cache.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+
+class RedisCache(LoggerMixin):
+    """Redis tier shared by every replica, between the process caches and ImageKit.
+    
+    Values are serialized protobuf messages. Listing keys are tracked in a set
+    so a write can drop every cached listing in one round trip. Redis errors
+    are logged and treated as a miss so reads fall through to ImageKit.
+    
+    Every invalidation bumps ``files:gen``; reads return the generation they
+    saw and a fetched value is only stored if it is still current, so a fetch
+    that raced a write cannot put stale data back for every replica.
+    """
+    
+    LIST_KEYS = "files:list:keys"
+    GENERATION_KEY = "files:gen"
+    
+    # SETEX KEYS[2] only if KEYS[1] still holds the generation the value was read under
+    _SET_IF_CURRENT = """
+        if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('SETEX', KEYS[2], ARGV[2], ARGV[3])
+        if KEYS[3] then
+            redis.call('SADD', KEYS[3], KEYS[2])
+        end
+        return 1
+    """
+    
+    def __init__(self, client: redis.Redis, ttl: int):
+        self._redis = client
+        self._ttl = ttl
+        self._set_if_current = self._redis.register_script(self._SET_IF_CURRENT)
+    
+    @staticmethod
+    def _details_key(file_id: str) -> str:
+        """Return the Redis key of a file's details."""
+        return f"file:{file_id}"
+    
+    @staticmethod
+    def _list_key(query: Hashable) -> str:
+        """Return the Redis key of a listing query."""
+        return "files:list:" + hashlib.sha1(repr(query).encode()).hexdigest()
+    
+    def _get(self, key: str) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """Return a cached value and the generation to store a fresh one under."""
+        try:
+            raw, generation = self._redis.mget(key, self.GENERATION_KEY)
+        except Exception as e:
+            self.logger.warning("Shared cache read failed", error=str(e))
+            return None, None
+        return raw, generation or b"0"
+    
+    def _set(self, generation: Optional[bytes], key: str, value: bytes, index_key: Optional[str] = None) -> None:
+        """Store a value unless the cache was invalidated since ``generation`` was read."""
+        if generation is None:
+            return
+        keys = [self.GENERATION_KEY, key] + ([index_key] if index_key else [])
+        try:
+            self._set_if_current(keys=keys, args=[generation, self._ttl, value])
+        except Exception as e:
+            self.logger.warning("Shared cache write failed", error=str(e))
+    
+    def get_file_details(self, file_id: str) -> Tuple[Optional[media_pb2.FileDetails], Optional[bytes]]:
+        """Return shared cached details of a file, or None, with the current generation."""
+        raw, generation = self._get(self._details_key(file_id))
+        file_details = media_pb2.FileDetails.FromString(raw) if raw is not None else None
+        return file_details, generation
+    
+    def set_file_details(
+        self,
+        generation: Optional[bytes],
+        file_id: str,
+        file_details: media_pb2.FileDetails
+    ) -> None:
+        """Share details of a file fetched under ``generation`` with other replicas."""
+        self._set(generation, self._details_key(file_id), file_details.SerializeToString())
+    
+    def get_files(self, query: Hashable) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Return a shared cached ``list_files`` result, or None, with the current generation."""
+        raw, generation = self._get(self._list_key(query))
+        if raw is None:
+            return None, generation
+        response = media_pb2.GetFilesResponse.FromString(raw)
+        return {"files": list(response.files), "total_count": response.total_count}, generation
+    
+    def set_files(self, generation: Optional[bytes], query: Hashable, listing: Dict[str, Any]) -> None:
+        """Share a ``list_files`` result fetched under ``generation`` with other replicas."""
+        response = media_pb2.GetFilesResponse(
+            files=listing["files"], total_count=listing["total_count"]
+        )
+        self._set(generation, self._list_key(query), response.SerializeToString(), self.LIST_KEYS)
+    
+    def invalidate(self, file_ids: Iterable[str]) -> None:
+        """Drop shared details of changed files along with every cached listing."""
+        try:
+            # Bumped before the listing keys are read so no fetch already in
+            # flight can store a listing this invalidation would miss
+            pipe = self._redis.pipeline()
+            pipe.incr(self.GENERATION_KEY)
+            pipe.smembers(self.LIST_KEYS)
+            _, list_keys = pipe.execute()
+            keys = [self._details_key(file_id) for file_id in file_ids]
+            keys.extend(list_keys)
+            keys.append(self.LIST_KEYS)
+            self._redis.delete(*keys)
+        except Exception as e:
+            self.logger.warning("Shared cache invalidation failed", error=str(e))
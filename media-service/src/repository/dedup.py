@@ -0,0 +1,107 @@
+"""Checksum index that lets identical uploads reuse an existing ImageKit file."""
+from typing import BinaryIO, Iterable, List, Optional, Union
+
+import blake3
+import orjson
+import redis
+
+from src.utils.logger import LoggerMixin
+
+# Bits in the "maybe seen" bitmap (2^24 bits = 2MB in Redis)
+BITMAP_BUCKETS = 1 << 24
+
+# Read file objects in pieces of this size while hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def content_digest(file_data: Union[bytes, BinaryIO]) -> str:
+    """Return the BLAKE3 hex digest of raw bytes or a seekable binary file object."""
+    if isinstance(file_data, (bytes, bytearray, memoryview)):
+        return blake3.blake3(file_data).hexdigest()
+    
+    hasher = blake3.blake3()
+    start = file_data.tell()
+    for chunk in iter(lambda: file_data.read(HASH_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    file_data.seek(start)
+    return hasher.hexdigest()
+
+
+class UploadDedupIndex(LoggerMixin):
+    """Maps uploads to ImageKit file IDs in Redis.
+    
+    ``dedup:bits`` is a bitmap answering "maybe seen" in one cheap GETBIT;
+    ``dedup:map`` holds the actual ``upload key -> file_id`` entries and
+    ``dedup:files`` the reverse, so deleting a file drops its entry. Redis
+    errors are logged and treated as a miss so uploads never fail on them.
+    """
+    
+    BITS_KEY = "dedup:bits"
+    MAP_KEY = "dedup:map"
+    FILES_KEY = "dedup:files"
+    
+    def __init__(self, client: redis.Redis):
+        self._redis = client
+    
+    @staticmethod
+    def upload_key(
+        digest: str,
+        folder: Optional[str],
+        filename: str,
+        tags: Optional[List[str]],
+        custom_coordinates: Optional[str],
+    ) -> str:
+        """Key an upload by its content and every option stored with the file.
+        
+        An upload only reuses a file stored with the same folder, name, tags
+        and coordinates, so no caller gets another caller's metadata.
+        """
+        options = orjson.dumps([folder or "/", filename, sorted(tags or ()), custom_coordinates or ""])
+        return f"{digest}:{blake3.blake3(options).hexdigest()[:16]}"
+    
+    @staticmethod
+    def _bucket(key: str) -> int:
+        """Map an upload key to its bit in the bitmap."""
+        return int(key[:8], 16) % BITMAP_BUCKETS
+    
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the file ID previously stored for this upload, if any."""
+        try:
+            if not self._redis.getbit(self.BITS_KEY, self._bucket(key)):
+                return None
+            file_id = self._redis.hget(self.MAP_KEY, key)
+            return file_id.decode() if file_id is not None else None
+        except Exception as e:
+            self.logger.warning("Dedup lookup failed", error=str(e))
+            return None
+    
+    def record(self, key: str, file_id: str) -> None:
+        """Remember the file ID stored for this upload."""
+        try:
+            pipe = self._redis.pipeline()
+            pipe.hset(self.MAP_KEY, key, file_id)
+            pipe.hset(self.FILES_KEY, file_id, key)
+            pipe.setbit(self.BITS_KEY, self._bucket(key), 1)
+            pipe.execute()
+        except Exception as e:
+            self.logger.warning("Dedup record failed", error=str(e), file_id=file_id)
+    
+    def forget(self, key: str) -> None:
+        """Drop a mapping whose file no longer exists."""
+        try:
+            self._redis.hdel(self.MAP_KEY, key)
+        except Exception as e:
+            self.logger.warning("Dedup forget failed", error=str(e))
+    
+    def forget_files(self, file_ids: Iterable[str]) -> None:
+        """Drop the mappings of deleted or changed files."""
+        file_ids = list(file_ids)
+        try:
+            keys = [key for key in self._redis.hmget(self.FILES_KEY, file_ids) if key]
+            pipe = self._redis.pipeline()
+            if keys:
+                pipe.hdel(self.MAP_KEY, *keys)
+            pipe.hdel(self.FILES_KEY, *file_ids)
+            pipe.execute()
+        except Exception as e:
+            self.logger.warning("Dedup forget failed", error=str(e))
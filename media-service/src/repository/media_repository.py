@@ -1,13 +1,129 @@
 """ImageKit client wrapper with error handling and logging."""
-from typing import Dict, List, Optional, Any, Union
-import base64
+import copy
+import hashlib
+import hmac
+import io
+import operator
+import threading
+import time
+import uuid
+from concurrent import futures
+from functools import lru_cache, partial
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union, cast
+from cachetools import LRUCache
 from imagekitio import ImageKit
 from imagekitio.models.UploadFileRequestOptions import UploadFileRequestOptions
 from imagekitio.models.ListAndSearchFileRequestOptions import ListAndSearchFileRequestOptions
+import requests
+from requests.adapters import HTTPAdapter
 
-from src.config.settings import settings
+from src.config.settings import get_settings
+from src.generated import media_pb2
+from src.repository.cache import CoalescingTTLCache, RedisCache
+from src.repository.dedup import UploadDedupIndex, content_digest
+from src.repository.redis_client import get_redis
 from src.utils.logger import LoggerMixin
-from src.utils.exceptions import ImageKitError, FileNotFoundError, FileSizeExceededError
+from src.utils.exceptions import ImageKitError, FileNotFoundError, FileSizeExceededError, InvalidFileError
+from src.utils.file_types import HEADER_SIZE, sniff_file_type
+
+settings = get_settings()
+
+# ImageKit accepts at most this many file IDs per bulk delete call
+BULK_DELETE_CHUNK_SIZE = 100
+BULK_DELETE_WORKERS = 8
+
+# Concurrent ImageKit requests when fetching details of several files
+BATCH_DETAILS_WORKERS = 16
+
+# Files fetched per ImageKit request when streaming a listing
+STREAM_PAGE_SIZE = 100
+
+# Endpoint clients POST to for direct uploads signed by get_authentication_parameters()
+IMAGEKIT_UPLOAD_URL = "https://upload.imagekit.io/api/v1/files/upload"
+
+# Lifetime of direct upload signatures, matching the SDK default
+UPLOAD_AUTH_TTL_SECONDS = 30 * 60
+
+# FileDetails fields copied from ImageKit SDK result objects
+FILE_DETAILS_FIELDS = (
+    "file_id",
+    "name",
+    "url",
+    "thumbnail_url",
+    "size",
+    "file_type",
+    "tags",
+    "folder_path",
+    "created_at",
+    "updated_at",
+    "width",
+    "height",
+    "custom_metadata",
+)
+
+# SDK result classes answer None for attributes they lack, so one precompiled
+# getter reads every field without per-field default handling
+_file_details_getter = operator.attrgetter(*FILE_DETAILS_FIELDS)
+
+
+class UploadReader(io.BufferedReader):
+    """Binary file of a known size, uploaded by ``upload_file`` as a multipart file.
+    
+    The SDK only sends ``BufferedReader`` objects as multipart files; bytes and
+    other objects become a filename-less form field that ImageKit reads as
+    base64 or a URL. The multipart encoder sizes parts with ``len()`` before
+    trying ``fileno()``, which would roll a spooled upload over to disk.
+    """
+    
+    def __init__(self, raw: IO[bytes], size: int):
+        # Any readable binary file with readinto() works as the raw stream
+        super().__init__(cast(io.RawIOBase, raw))
+        self._size = size
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Tell whether an ImageKit SDK exception reports a missing file (HTTP 404)."""
+    response_metadata = getattr(error, "response_metadata", None)
+    return response_metadata is not None and response_metadata.http_status_code == 404
+
+
+def create_http_session() -> requests.Session:
+    """Create a keep-alive session shared by every ImageKit API call."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.imagekit_pool_size,
+        pool_maxsize=settings.imagekit_pool_size,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=256)
+def _list_options_template(
+    limit: int,
+    search_query: Optional[str],
+    tags: Tuple[str, ...],
+    file_type: Optional[str],
+    sort: Optional[str],
+    path: Optional[str],
+) -> ListAndSearchFileRequestOptions:
+    """Build list options once per filter set; callers copy it and set ``skip``.
+    
+    The SDK only reads the options' ``__dict__``, so a shared template is never mutated.
+    """
+    return ListAndSearchFileRequestOptions(
+        type=file_type,
+        sort=sort,
+        path=path,
+        search_query=search_query,
+        file_type=file_type,
+        tags=",".join(tags) if tags else None,
+        limit=limit,
+    )
 
 
 class MediaRepository(LoggerMixin):
@@ -21,20 +137,65 @@ class MediaRepository(LoggerMixin):
                 public_key=settings.imagekit_public_key,
                 url_endpoint=settings.imagekit_url_endpoint,
             )
+            # The SDK calls requests.request() per API call, opening a new TLS
+            # connection each time; route it through one pooled session instead
+            self._http = create_http_session()
+            self.client.ik_request.request = partial(self._http.request, timeout=settings.imagekit_timeout)
             self.logger.info("ImageKit client initialized successfully")
         except Exception as e:
             self.logger.error("Failed to initialize ImageKit client", error=str(e))
             raise ImageKitError(f"Failed to initialize ImageKit client: {str(e)}")
+        
+        # Upload signatures are HMAC-SHA1(private_key, token + expire); keying the
+        # HMAC once lets each signature start from a copy of the keyed state
+        self._upload_auth_hmac = hmac.new(
+            settings.imagekit_private_key.encode(), digestmod=hashlib.sha1
+        )
+        
+        # Shared pool for sending bulk delete chunks concurrently
+        self._bulk_delete_executor = futures.ThreadPoolExecutor(
+            max_workers=BULK_DELETE_WORKERS, thread_name_prefix="bulk-delete"
+        )
+        self._batch_details_executor = futures.ThreadPoolExecutor(
+            max_workers=BATCH_DETAILS_WORKERS, thread_name_prefix="batch-details"
+        )
+        self._page_prefetch_executor = futures.ThreadPoolExecutor(
+            max_workers=settings.max_workers, thread_name_prefix="page-prefetch"
+        )
+        
+        # Read caches; writes below invalidate the entries they affect
+        self._details_cache = CoalescingTTLCache(settings.cache_max_entries, settings.cache_ttl_seconds)
+        self._list_cache = CoalescingTTLCache(settings.cache_max_entries, settings.cache_ttl_seconds)
+        # Built FileDetails by file ID with the updated_at they were built from;
+        # unchanged files in later listings reuse them instead of being rebuilt
+        self._proto_cache: LRUCache = LRUCache(maxsize=settings.cache_max_entries)
+        self._proto_cache_lock = threading.Lock()
+        # Process cache misses check Redis before ImageKit so replicas share hits,
+        # and identical uploads reuse the stored file, when Redis is configured
+        redis_client = get_redis()
+        self._shared_cache = (
+            RedisCache(redis_client, settings.shared_cache_ttl_seconds)
+            if redis_client is not None else None
+        )
+        self._dedup = UploadDedupIndex(redis_client) if redis_client is not None else None
     
     def get_authentication_parameters(self) -> Dict[str, Any]:
-        """Get authentication parameters for client-side uploads."""
+        """Get authentication parameters for client-side uploads.
+        
+        ImageKit accepts each token for a single upload, so parameters are
+        signed locally per call rather than cached.
+        """
         try:
-            auth_params = self.client.get_authentication_parameters()
-            self.logger.info("Generated authentication parameters")
+            token = str(uuid.uuid4())
+            expire = int(time.time()) + UPLOAD_AUTH_TTL_SECONDS
+            signer = self._upload_auth_hmac.copy()
+            signer.update(f"{token}{expire}".encode())
+            self.sampled_info("Generated authentication parameters")
             return {
-                "token": auth_params["token"],
-                "expire": auth_params["expire"],
-                "signature": auth_params["signature"]
+                "token": token,
+                "expire": expire,
+                "signature": signer.hexdigest(),
+                "upload_url": IMAGEKIT_UPLOAD_URL
             }
         except Exception as e:
             self.logger.error("Failed to get authentication parameters", error=str(e))
@@ -42,14 +203,14 @@ class MediaRepository(LoggerMixin):
     
     def upload_file(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, UploadReader],
         filename: str,
         folder: Optional[str] = None,
         tags: Optional[List[str]] = None,
         use_unique_filename: bool = True,
         custom_coordinates: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Upload a file to ImageKit."""
+    ) -> media_pb2.FileDetails:
+        """Upload raw bytes or a sized file (positioned at its start) to ImageKit."""
         try:
             # Check file size
             file_size_mb = len(file_data) / (1024 * 1024)
@@ -58,6 +219,24 @@ class MediaRepository(LoggerMixin):
                     f"File size {file_size_mb:.2f}MB exceeds limit of {settings.max_file_size_mb}MB"
                 )
             
+            # Reject unknown content from its leading bytes before any hashing or upload
+            if settings.validate_file_types:
+                self._check_file_type(file_data, filename)
+            
+            dedup_key = None
+            if self._dedup is not None:
+                dedup_key = self._dedup.upload_key(
+                    content_digest(file_data), folder, filename, tags, custom_coordinates
+                )
+                existing = self._find_duplicate(dedup_key)
+                if existing is not None:
+                    self.sampled_info(
+                        "Skipping upload of duplicate file",
+                        filename=filename,
+                        file_id=existing.file_id
+                    )
+                    return existing
+            
             # Prepare upload options
             options = UploadFileRequestOptions(
                 use_unique_file_name=use_unique_filename,
@@ -66,10 +245,7 @@ class MediaRepository(LoggerMixin):
                 custom_coordinates=custom_coordinates,
             )
             
-            # Convert bytes to base64 string
-            file_base64 = base64.b64encode(file_data).decode('utf-8')
-            
-            self.logger.info(
+            self.sampled_info(
                 "Uploading file",
                 filename=filename,
                 size_mb=f"{file_size_mb:.2f}",
@@ -77,8 +253,11 @@ class MediaRepository(LoggerMixin):
                 tags=tags
             )
             
+            upload = file_data
+            if isinstance(file_data, (bytes, bytearray, memoryview)):
+                upload = UploadReader(io.BytesIO(file_data), len(file_data))
             result = self.client.upload_file(
-                file=file_base64,
+                file=upload,
                 file_name=filename,
                 options=options
             )
@@ -86,19 +265,117 @@ class MediaRepository(LoggerMixin):
             if result.response_metadata.http_status_code != 200:
                 raise ImageKitError(f"Upload failed: {result.response_metadata.raw}")
             
-            self.logger.info("File uploaded successfully", file_id=result.file_id)
-            return self._format_file_details(result)
+            self.sampled_info("File uploaded successfully", file_id=result.file_id)
+            self._invalidate(())
+            if dedup_key is not None:
+                self._dedup.record(dedup_key, result.file_id)
+            return self.to_proto(result)
             
-        except FileSizeExceededError:
+        except (FileSizeExceededError, InvalidFileError):
             raise
         except Exception as e:
             self.logger.error("File upload failed", error=str(e), filename=filename)
             raise ImageKitError(f"File upload failed: {str(e)}")
     
-    def get_file_details(self, file_id: str) -> Dict[str, Any]:
+    @staticmethod
+    def _check_file_type(file_data: Union[bytes, UploadReader], filename: str) -> None:
+        """Raise InvalidFileError unless the content starts with a known file signature."""
+        if isinstance(file_data, (bytes, bytearray, memoryview)):
+            header = bytes(file_data[:HEADER_SIZE])
+        else:
+            start = file_data.tell()
+            header = file_data.read(HEADER_SIZE)
+            file_data.seek(start)
+        
+        if sniff_file_type(header) is None:
+            raise InvalidFileError(f"Unsupported or unrecognised file content: {filename}")
+    
+    def _find_duplicate(self, dedup_key: str) -> Optional[media_pb2.FileDetails]:
+        """Return details of an already stored identical upload, if any."""
+        file_id = self._dedup.lookup(dedup_key)
+        if file_id is None:
+            return None
+        
+        try:
+            return self.get_file_details(file_id)
+        except FileNotFoundError:
+            # Deleted since it was recorded
+            self._dedup.forget(dedup_key)
+            return None
+        except Exception as e:
+            # A failed lookup only costs the dedup, never the upload
+            self.logger.warning("Dedup file lookup failed", error=str(e), file_id=file_id)
+            return None
+    
+    def get_file_details(self, file_id: str) -> media_pb2.FileDetails:
         """Get details of a specific file."""
+        file_details, cache_hit = self._details_cache.get_or_load(
+            file_id, lambda: self._load_file_details(file_id)
+        )
+        self.sampled_info("File details retrieved", file_id=file_id, cache_hit=cache_hit)
+        return file_details
+    
+    def cached_file_details(self, file_id: str) -> Optional[media_pb2.FileDetails]:
+        """Return cached details of a file without calling ImageKit, or None."""
+        file_details = self._details_cache.get(file_id)
+        if file_details is not None:
+            self.sampled_info("File details retrieved", file_id=file_id, cache_hit=True)
+        return file_details
+    
+    def get_file_details_batch(
+        self, file_ids: List[str]
+    ) -> Tuple[Dict[str, media_pb2.FileDetails], Dict[str, str]]:
+        """Get details of several files, returning found files and per-file errors by ID."""
+        if len(file_ids) > settings.max_files_per_batch_details:
+            raise InvalidFileError(
+                f"Cannot get details of more than {settings.max_files_per_batch_details} files at once"
+            )
+        
+        files: Dict[str, media_pb2.FileDetails] = {}
+        errors: Dict[str, str] = {}
+        missing: List[str] = []
+        for file_id in dict.fromkeys(file_ids):
+            cached = self._details_cache.get(file_id)
+            if cached is not None:
+                files[file_id] = cached
+            else:
+                missing.append(file_id)
+        
+        # Only uncached files go to ImageKit, concurrently
+        pending = {
+            self._batch_details_executor.submit(self.get_file_details, file_id): file_id
+            for file_id in missing
+        }
+        for future in futures.as_completed(pending):
+            file_id = pending[future]
+            try:
+                files[file_id] = future.result()
+            except Exception as e:
+                errors[file_id] = str(e)
+        
+        self.sampled_info(
+            "Batch file details retrieved",
+            requested=len(file_ids),
+            cached=len(file_ids) - len(missing),
+            failed=len(errors)
+        )
+        return files, errors
+    
+    def _load_file_details(self, file_id: str) -> media_pb2.FileDetails:
+        """Load details of a file from the shared cache or, failing that, ImageKit."""
+        if self._shared_cache is None:
+            return self._fetch_file_details(file_id)
+        
+        file_details, generation = self._shared_cache.get_file_details(file_id)
+        if file_details is None:
+            file_details = self._fetch_file_details(file_id)
+            self._shared_cache.set_file_details(generation, file_id, file_details)
+        return file_details
+    
+    def _fetch_file_details(self, file_id: str) -> media_pb2.FileDetails:
+        """Fetch details of a specific file from ImageKit."""
         try:
-            self.logger.info("Fetching file details", file_id=file_id)
+            self.sampled_info("Fetching file details", file_id=file_id)
             result = self.client.get_file_details(file_id)
             
             if result.response_metadata.http_status_code == 404:
@@ -106,12 +383,13 @@ class MediaRepository(LoggerMixin):
             elif result.response_metadata.http_status_code != 200:
                 raise ImageKitError(f"Failed to get file details: {result.response_metadata.raw}")
             
-            self.logger.info("File details retrieved", file_id=file_id)
-            return self._format_file_details(result)
+            return self._reuse_proto(result)
             
         except FileNotFoundError:
             raise
         except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"File not found: {file_id}")
             self.logger.error("Failed to get file details", error=str(e), file_id=file_id)
             raise ImageKitError(f"Failed to get file details: {str(e)}")
     
@@ -125,20 +403,115 @@ class MediaRepository(LoggerMixin):
         sort: Optional[str] = None,
         path: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """List files with optional filters."""
+        """List files with optional filters, returning ``files`` as FileDetails messages."""
+        key = self._list_key(skip, limit, search_query, tags, file_type, sort, path)
+        listing, cache_hit = self._list_cache.get_or_load(
+            key, lambda: self._load_files(key, skip, limit, search_query, tags, file_type, sort, path)
+        )
+        self.sampled_info("Files listed successfully", count=len(listing["files"]), cache_hit=cache_hit)
+        return listing
+    
+    def iter_file_pages(
+        self,
+        skip: int = 0,
+        limit: int = 1000,
+        search_query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        file_type: Optional[str] = None,
+        sort: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> Iterator[List[media_pb2.FileDetails]]:
+        """Yield up to ``limit`` files in pages, fetching the next page while the caller uses this one."""
+        def fetch(page_skip: int, page_limit: int) -> List[media_pb2.FileDetails]:
+            return self.list_files(
+                page_skip, page_limit, search_query, tags, file_type, sort, path
+            )["files"]
+        
+        remaining = limit
+        page_limit = min(STREAM_PAGE_SIZE, remaining)
+        next_page = self._page_prefetch_executor.submit(fetch, skip, page_limit)
+        while next_page is not None:
+            files = next_page.result()
+            skip += len(files)
+            remaining -= len(files)
+            next_page = None
+            # A short page means ImageKit has no more files
+            if len(files) == page_limit and remaining > 0:
+                page_limit = min(STREAM_PAGE_SIZE, remaining)
+                next_page = self._page_prefetch_executor.submit(fetch, skip, page_limit)
+            yield files
+    
+    def cached_files(
+        self,
+        skip: int = 0,
+        limit: int = 1000,
+        search_query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        file_type: Optional[str] = None,
+        sort: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached ``list_files`` result without calling ImageKit, or None."""
+        listing = self._list_cache.get(
+            self._list_key(skip, limit, search_query, tags, file_type, sort, path)
+        )
+        if listing is not None:
+            self.sampled_info("Files listed successfully", count=len(listing["files"]), cache_hit=True)
+        return listing
+    
+    @staticmethod
+    def _list_key(
+        skip: int,
+        limit: int,
+        search_query: Optional[str],
+        tags: Optional[List[str]],
+        file_type: Optional[str],
+        sort: Optional[str],
+        path: Optional[str],
+    ) -> Tuple:
+        """Normalize list parameters into a cache key."""
+        return (skip, limit, search_query, tuple(sorted(tags or ())), file_type, sort, path)
+    
+    def _load_files(
+        self,
+        key: Tuple,
+        skip: int,
+        limit: int,
+        search_query: Optional[str],
+        tags: Optional[List[str]],
+        file_type: Optional[str],
+        sort: Optional[str],
+        path: Optional[str],
+    ) -> Dict[str, Any]:
+        """Load one page of files from the shared cache or, failing that, ImageKit."""
+        if self._shared_cache is None:
+            return self._fetch_files(skip, limit, search_query, tags, file_type, sort, path)
+        
+        listing, generation = self._shared_cache.get_files(key)
+        if listing is None:
+            listing = self._fetch_files(skip, limit, search_query, tags, file_type, sort, path)
+            self._shared_cache.set_files(generation, key, listing)
+        return listing
+    
+    def _fetch_files(
+        self,
+        skip: int,
+        limit: int,
+        search_query: Optional[str],
+        tags: Optional[List[str]],
+        file_type: Optional[str],
+        sort: Optional[str],
+        path: Optional[str],
+    ) -> Dict[str, Any]:
+        """Fetch one page of files from ImageKit."""
         try:
-            options = ListAndSearchFileRequestOptions(
-                type=file_type,
-                sort=sort,
-                path=path,
-                search_query=search_query,
-                file_type=file_type,
-                tags=",".join(tags) if tags else None,
-                limit=limit,
-                skip=skip,
-            )
+            # Paginated scans reuse the options of the same filters with a new skip
+            options = copy.copy(_list_options_template(
+                limit, search_query, tuple(sorted(tags or ())), file_type, sort, path
+            ))
+            options.skip = skip
             
-            self.logger.info(
+            self.sampled_info(
                 "Listing files",
                 skip=skip,
                 limit=limit,
@@ -152,9 +525,8 @@ class MediaRepository(LoggerMixin):
             if result.response_metadata.http_status_code != 200:
                 raise ImageKitError(f"Failed to list files: {result.response_metadata.raw}")
             
-            files = [self._format_file_details(file) for file in result.list]
+            files = [self._reuse_proto(file) for file in result.list]
             
-            self.logger.info("Files listed successfully", count=len(files))
             return {
                 "files": files,
                 "total_count": getattr(result, 'total_count', len(files))
@@ -167,7 +539,7 @@ class MediaRepository(LoggerMixin):
     def delete_file(self, file_id: str) -> bool:
         """Delete a single file."""
         try:
-            self.logger.info("Deleting file", file_id=file_id)
+            self.sampled_info("Deleting file", file_id=file_id)
             result = self.client.delete_file(file_id)
             
             if result.response_metadata.http_status_code == 404:
@@ -175,12 +547,15 @@ class MediaRepository(LoggerMixin):
             elif result.response_metadata.http_status_code != 204:
                 raise ImageKitError(f"Failed to delete file: {result.response_metadata.raw}")
             
-            self.logger.info("File deleted successfully", file_id=file_id)
+            self.sampled_info("File deleted successfully", file_id=file_id)
+            self.invalidate_file(file_id)
             return True
             
         except FileNotFoundError:
             raise
         except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"File not found: {file_id}")
             self.logger.error("Failed to delete file", error=str(e), file_id=file_id)
             raise ImageKitError(f"Failed to delete file: {str(e)}")
     
@@ -188,20 +563,36 @@ class MediaRepository(LoggerMixin):
         """Delete multiple files in bulk."""
         try:
             if len(file_ids) > settings.max_files_per_batch_delete:
-                raise ImageKitError(
+                raise InvalidFileError(
                     f"Cannot delete more than {settings.max_files_per_batch_delete} files at once"
                 )
             
-            self.logger.info("Bulk deleting files", file_count=len(file_ids))
-            result = self.client.bulk_file_delete(file_ids)
+            self.sampled_info("Bulk deleting files", file_count=len(file_ids))
+            chunks = [
+                file_ids[i:i + BULK_DELETE_CHUNK_SIZE]
+                for i in range(0, len(file_ids), BULK_DELETE_CHUNK_SIZE)
+            ]
+            if len(chunks) == 1:
+                chunk_results = [self._bulk_delete_chunk(chunks[0])]
+            else:
+                chunk_results = self._bulk_delete_executor.map(self._bulk_delete_chunk, chunks)
             
-            if result.response_metadata.http_status_code != 200:
-                raise ImageKitError(f"Bulk delete failed: {result.response_metadata.raw}")
+            # Merge chunk results into sets for O(1) lookups below; a failed
+            # chunk only fails its own files
+            successful_deletes: Set[str] = set()
+            missing_files: Set[str] = set()
+            chunk_errors: Dict[str, str] = {}
+            for chunk, (deleted, missing, error) in zip(chunks, chunk_results):
+                successful_deletes.update(deleted)
+                missing_files.update(missing)
+                if error:
+                    chunk_errors.update(dict.fromkeys(chunk, error))
+            
+            if successful_deletes:
+                self._invalidate(successful_deletes)
             
             # Process results
             results = []
-            successful_deletes = result.successfully_deleted_file_ids or []
-            
             for file_id in file_ids:
                 if file_id in successful_deletes:
                     results.append({
@@ -209,20 +600,21 @@ class MediaRepository(LoggerMixin):
                         "success": True,
                         "error_message": ""
                     })
+                elif file_id in missing_files:
+                    results.append({
+                        "file_id": file_id,
+                        "success": False,
+                        "error_message": "File not found"
+                    })
                 else:
-                    # Find error message from missing files
-                    error_msg = "Unknown error"
-                    if hasattr(result, 'missing_file_ids') and file_id in result.missing_file_ids:
-                        error_msg = "File not found"
-                    
                     results.append({
                         "file_id": file_id,
                         "success": False,
-                        "error_message": error_msg
+                        "error_message": chunk_errors.get(file_id, "Unknown error")
                     })
             
-            success_count = len(successful_deletes)
-            self.logger.info(
+            success_count = sum(1 for result in results if result["success"])
+            self.sampled_info(
                 "Bulk delete completed",
                 total=len(file_ids),
                 successful=success_count,
@@ -231,17 +623,36 @@ class MediaRepository(LoggerMixin):
             
             return results
             
+        except InvalidFileError:
+            raise
         except Exception as e:
             self.logger.error("Bulk delete failed", error=str(e))
             raise ImageKitError(f"Bulk delete failed: {str(e)}")
     
+    def _bulk_delete_chunk(self, file_ids: List[str]) -> Tuple[List[str], List[str], str]:
+        """Delete one chunk of files, returning the deleted and missing file IDs and any error."""
+        try:
+            result = self.client.bulk_file_delete(file_ids)
+            
+            if result.response_metadata.http_status_code != 200:
+                raise ImageKitError(f"Bulk delete failed: {result.response_metadata.raw}")
+        except Exception as e:
+            self.logger.error("Bulk delete chunk failed", error=str(e), file_count=len(file_ids))
+            return [], [], f"Bulk delete failed: {str(e)}"
+        
+        return (
+            result.successfully_deleted_file_ids or [],
+            getattr(result, 'missing_file_ids', None) or [],
+            ""
+        )
+    
     def update_file_details(
         self,
         file_id: str,
         tags: Optional[List[str]] = None,
         custom_coordinates: Optional[str] = None,
         custom_metadata: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+    ) -> media_pb2.FileDetails:
         """Update file details."""
         try:
             update_data = {}
@@ -252,7 +663,7 @@ class MediaRepository(LoggerMixin):
             if custom_metadata is not None:
                 update_data["custom_metadata"] = custom_metadata
             
-            self.logger.info("Updating file details", file_id=file_id, updates=list(update_data.keys()))
+            self.sampled_info("Updating file details", file_id=file_id, updates=list(update_data.keys()))
             result = self.client.update_file_details(file_id, update_data)
             
             if result.response_metadata.http_status_code == 404:
@@ -260,29 +671,73 @@ class MediaRepository(LoggerMixin):
             elif result.response_metadata.http_status_code != 200:
                 raise ImageKitError(f"Failed to update file: {result.response_metadata.raw}")
             
-            self.logger.info("File details updated successfully", file_id=file_id)
-            return self._format_file_details(result)
+            self.sampled_info("File details updated successfully", file_id=file_id)
+            self.invalidate_file(file_id)
+            return self.to_proto(result)
             
         except FileNotFoundError:
             raise
         except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"File not found: {file_id}")
             self.logger.error("Failed to update file details", error=str(e), file_id=file_id)
             raise ImageKitError(f"Failed to update file details: {str(e)}")
     
-    def _format_file_details(self, file_obj: Any) -> Dict[str, Any]:
-        """Format file object into a consistent dictionary."""
-        return {
-            "file_id": getattr(file_obj, 'file_id', ''),
-            "name": getattr(file_obj, 'name', ''),
-            "url": getattr(file_obj, 'url', ''),
-            "thumbnail_url": getattr(file_obj, 'thumbnail_url', ''),
-            "size": getattr(file_obj, 'size', 0),
-            "file_type": getattr(file_obj, 'file_type', ''),
-            "tags": getattr(file_obj, 'tags', []) or [],
-            "folder_path": getattr(file_obj, 'folder_path', ''),
-            "created_at": getattr(file_obj, 'created_at', ''),
-            "updated_at": getattr(file_obj, 'updated_at', ''),
-            "width": getattr(file_obj, 'width', 0),
-            "height": getattr(file_obj, 'height', 0),
-            "custom_metadata": getattr(file_obj, 'custom_metadata', {}) or {},
-        }
\ No newline at end of file
+    def invalidate_file(self, file_id: str) -> None:
+        """Drop cached reads that may include a changed file."""
+        self._invalidate((file_id,))
+    
+    def _invalidate(self, file_ids: Iterable[str]) -> None:
+        """Drop cached details of changed files and every cached listing, in both tiers."""
+        for file_id in file_ids:
+            self._details_cache.invalidate(file_id)
+            with self._proto_cache_lock:
+                self._proto_cache.pop(file_id, None)
+        self._list_cache.clear()
+        if self._shared_cache is not None:
+            self._shared_cache.invalidate(file_ids)
+        # Uploads must not be answered with a deleted or since-edited file
+        if self._dedup is not None and file_ids:
+            self._dedup.forget_files(file_ids)
+    
+    def _reuse_proto(self, file_obj: Any) -> media_pb2.FileDetails:
+        """Return the FileDetails built earlier for this file version, or build it."""
+        file_id = file_obj.file_id
+        updated_at = file_obj.updated_at
+        if not (file_id and updated_at):
+            return self.to_proto(file_obj)
+        
+        with self._proto_cache_lock:
+            cached = self._proto_cache.get(file_id)
+        if cached is not None and cached[0] == updated_at:
+            return cached[1]
+        
+        file_details = self.to_proto(file_obj)
+        with self._proto_cache_lock:
+            self._proto_cache[file_id] = (updated_at, file_details)
+        return file_details
+    
+    @staticmethod
+    def to_proto(file_obj: Any) -> media_pb2.FileDetails:
+        """Build a FileDetails message straight from an ImageKit SDK result object."""
+        try:
+            values = _file_details_getter(file_obj)
+        except AttributeError:
+            values = tuple(getattr(file_obj, name, None) for name in FILE_DETAILS_FIELDS)
+        (file_id, name, url, thumbnail_url, size, file_type, tags, folder_path,
+         created_at, updated_at, width, height, custom_metadata) = values
+        return media_pb2.FileDetails(
+            file_id=file_id or "",
+            name=name or "",
+            url=url or "",
+            thumbnail_url=thumbnail_url or "",
+            size=size or 0,
+            file_type=file_type or "",
+            tags=tags or (),
+            folder_path=folder_path or "",
+            created_at=created_at or "",
+            updated_at=updated_at or "",
+            width=width or 0,
+            height=height or 0,
+            custom_metadata=custom_metadata or {},
+        )
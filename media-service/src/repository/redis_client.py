@@ -0,0 +1,16 @@
+"""Redis connection shared by the read cache, upload dedup and delete job store."""
+from functools import lru_cache
+from typing import Optional
+
+import redis
+
+from src.config.settings import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Optional[redis.Redis]:
+    """Return the process-wide Redis client, or None when REDIS_URL is not set."""
+    settings = get_settings()
+    if not settings.redis_url:
+        return None
+    return redis.Redis.from_url(settings.redis_url)
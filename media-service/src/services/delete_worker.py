@@ -0,0 +1,331 @@
+"""Background worker that runs file deletes off the request path."""
+import threading
+import time
+import uuid
+from concurrent import futures
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import orjson
+import redis
+
+from src.config.settings import get_settings
+from src.repository.redis_client import get_redis
+from src.utils.logger import LoggerMixin
+
+settings = get_settings()
+
+# Delete job states reported by GetDeleteJobStatus
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Finished jobs stay queryable for this long in Redis
+JOB_TTL_SECONDS = 24 * 60 * 60
+
+# Oldest jobs are dropped past this count when jobs are kept in memory
+MAX_IN_MEMORY_JOBS = 10_000
+
+# A replica owns the jobs it queued while it keeps renewing their leases;
+# jobs whose lease lapses are taken over by another replica
+JOB_LEASE_MS = 30_000
+JOB_HEARTBEAT_SECONDS = 10
+
+
+def _job(
+    status: str,
+    file_ids: List[str],
+    results: Optional[List[Dict[str, Any]]] = None,
+    error_message: str = ""
+) -> Dict[str, Any]:
+    """Build a job state record."""
+    return {
+        "status": status,
+        "file_ids": file_ids,
+        "results": results or [],
+        "error_message": error_message,
+    }
+
+
+class InMemoryJobStore:
+    """Process-local job state, used when Redis is not configured."""
+    
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def save(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Store the latest state of a job."""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._jobs[job_id] = job
+            if len(self._jobs) > MAX_IN_MEMORY_JOBS:
+                del self._jobs[next(iter(self._jobs))]
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the state of a job, if known."""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def pending(self) -> List[str]:
+        """Return jobs left unfinished by a previous process (none in memory)."""
+        return []
+    
+    def claim(self, job_id: str) -> bool:
+        """Take ownership of a job (always granted in memory)."""
+        return True
+    
+    def renew(self, job_ids: Iterable[str]) -> None:
+        """Extend the leases of owned jobs (nothing to do in memory)."""
+    
+    def release(self, job_id: str) -> None:
+        """Give up ownership of a job (nothing to do in memory)."""
+
+
+class RedisJobStore:
+    """Job state in ``job:{id}`` Redis hashes, so queued deletes survive restarts.
+    
+    Every unfinished job has a ``job:{id}:lease`` key set by the replica that
+    owns it; a job is only resumed by another replica once that key expires.
+    """
+    
+    PENDING_KEY = "delete_jobs:pending"
+    
+    # PEXPIRE KEYS[1] only while it still holds this replica's owner ID
+    _RENEW_IF_OWNER = """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+        end
+        return 0
+    """
+    
+    # DEL KEYS[1] only while it still holds this replica's owner ID
+    _RELEASE_IF_OWNER = """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+    
+    def __init__(self, client: redis.Redis):
+        self._redis = client
+        self._owner = uuid.uuid4().hex
+        self._renew_if_owner = self._redis.register_script(self._RENEW_IF_OWNER)
+        self._release_if_owner = self._redis.register_script(self._RELEASE_IF_OWNER)
+    
+    @staticmethod
+    def _lease_key(job_id: str) -> str:
+        """Return the Redis key of a job's lease."""
+        return f"job:{job_id}:lease"
+    
+    def save(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Store the latest state of a job."""
+        key = f"job:{job_id}"
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping={
+            "status": job["status"],
+            "file_ids": orjson.dumps(job["file_ids"]),
+            "results": orjson.dumps(job["results"]),
+            "error_message": job["error_message"],
+        })
+        if job["status"] in (JOB_PENDING, JOB_RUNNING):
+            pipe.sadd(self.PENDING_KEY, job_id)
+        else:
+            pipe.srem(self.PENDING_KEY, job_id)
+            pipe.expire(key, JOB_TTL_SECONDS)
+            pipe.delete(self._lease_key(job_id))
+        pipe.execute()
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the state of a job, if known."""
+        data = self._redis.hgetall(f"job:{job_id}")
+        if not data:
+            return None
+        return _job(
+            data[b"status"].decode(),
+            orjson.loads(data[b"file_ids"]),
+            orjson.loads(data[b"results"]),
+            data.get(b"error_message", b"").decode()
+        )
+    
+    def pending(self) -> List[str]:
+        """Return jobs that are queued or running on any replica."""
+        return [job_id.decode() for job_id in self._redis.smembers(self.PENDING_KEY)]
+    
+    def claim(self, job_id: str) -> bool:
+        """Take ownership of a job unless another replica holds a live lease on it."""
+        return bool(self._redis.set(self._lease_key(job_id), self._owner, nx=True, px=JOB_LEASE_MS))
+    
+    def renew(self, job_ids: Iterable[str]) -> None:
+        """Extend the leases of jobs this replica still owns."""
+        pipe = self._redis.pipeline()
+        for job_id in job_ids:
+            # A lease another replica took over after this one stalled is left alone
+            self._renew_if_owner(
+                keys=[self._lease_key(job_id)], args=[self._owner, JOB_LEASE_MS], client=pipe
+            )
+        pipe.execute()
+    
+    def release(self, job_id: str) -> None:
+        """Drop this replica's lease on a job it will not run."""
+        self._release_if_owner(keys=[self._lease_key(job_id)], args=[self._owner])
+
+
+def create_job_store():
+    """Use Redis for job state when REDIS_URL is set, otherwise keep it in memory."""
+    client = get_redis()
+    if client is not None:
+        return RedisJobStore(client)
+    return InMemoryJobStore()
+
+
+class DeleteWorker(LoggerMixin):
+    """Runs bulk deletes on a bounded thread pool and tracks them as jobs."""
+    
+    def __init__(self, repository, store=None):
+        self.repository = repository
+        self.store = store or create_job_store()
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=settings.delete_workers, thread_name_prefix="delete-worker"
+        )
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        # Unfinished jobs whose leases this process keeps renewing
+        self._owned: Set[str] = set()
+        self._owned_lock = threading.Lock()
+        self._resume_pending_jobs()
+        threading.Thread(target=self._heartbeat, name="delete-heartbeat", daemon=True).start()
+    
+    def submit(self, file_ids: List[str]) -> Tuple[str, futures.Future]:
+        """Queue a delete job and return its ID with a future for its results."""
+        job_id = uuid.uuid4().hex
+        # Claimed before it is listed as pending so no other replica resumes it
+        self._claim(job_id)
+        self._save(job_id, _job(JOB_PENDING, file_ids))
+        
+        with self._pending_lock:
+            queue_full = self._pending >= settings.delete_queue_max_pending
+            if not queue_full:
+                self._pending += 1
+        
+        if not queue_full:
+            return job_id, self._executor.submit(self._run_queued, job_id, file_ids)
+        
+        # Queue is saturated: run on the caller's thread instead of growing the backlog
+        self.logger.warning("Delete queue full, running job inline", job_id=job_id)
+        future: futures.Future = futures.Future()
+        try:
+            future.set_result(self._run(job_id, file_ids))
+        except Exception as e:
+            future.set_exception(e)
+        return job_id, future
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the state of a delete job, if known."""
+        return self.store.get(job_id)
+    
+    def _save(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Record job state; store errors are logged so deletes still run."""
+        try:
+            self.store.save(job_id, job)
+        except Exception as e:
+            self.logger.warning("Delete job state not saved", job_id=job_id, error=str(e))
+    
+    def _claim(self, job_id: str) -> bool:
+        """Take ownership of a job, returning False if another replica owns it."""
+        try:
+            if not self.store.claim(job_id):
+                return False
+        except Exception as e:
+            self.logger.warning("Delete job lease not taken", job_id=job_id, error=str(e))
+        with self._owned_lock:
+            self._owned.add(job_id)
+        return True
+    
+    def _run_queued(self, job_id: str, file_ids: List[str]) -> List[Dict[str, Any]]:
+        """Run a job taken from the queue."""
+        try:
+            return self._run(job_id, file_ids)
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+    
+    def _run(self, job_id: str, file_ids: List[str]) -> List[Dict[str, Any]]:
+        """Delete the files of a job and record the outcome."""
+        try:
+            # Never repeat a job another replica has finished meanwhile
+            finished = self._finished_job(job_id)
+            if finished is not None:
+                self.logger.info("Delete job already finished", job_id=job_id, status=finished["status"])
+                return finished["results"]
+            
+            self._save(job_id, _job(JOB_RUNNING, file_ids))
+            try:
+                results = self.repository.bulk_delete_files(file_ids)
+            except Exception as e:
+                self.logger.error("Delete job failed", job_id=job_id, error=str(e))
+                self._save(job_id, _job(JOB_FAILED, file_ids, error_message=str(e)))
+                raise
+            
+            self._save(job_id, _job(JOB_COMPLETED, file_ids, results))
+            self.sampled_info("Delete job completed", job_id=job_id, file_count=len(file_ids))
+            return results
+        finally:
+            with self._owned_lock:
+                self._owned.discard(job_id)
+    
+    def _finished_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored state of a job if it already completed or failed."""
+        try:
+            job = self.store.get(job_id)
+        except Exception as e:
+            self.logger.warning("Delete job state not read", job_id=job_id, error=str(e))
+            return None
+        if job is None or job["status"] in (JOB_PENDING, JOB_RUNNING):
+            return None
+        return job
+    
+    def _heartbeat(self) -> None:
+        """Keep leases of owned jobs alive and take over jobs whose owner stopped."""
+        while True:
+            time.sleep(JOB_HEARTBEAT_SECONDS)
+            with self._owned_lock:
+                owned = list(self._owned)
+            try:
+                if owned:
+                    self.store.renew(owned)
+            except Exception as e:
+                self.logger.warning("Delete job leases not renewed", error=str(e))
+            self._resume_pending_jobs()
+    
+    def _resume_pending_jobs(self) -> None:
+        """Requeue unfinished jobs whose owning replica stopped renewing their lease."""
+        try:
+            job_ids = self.store.pending()
+        except Exception as e:
+            self.logger.warning("Pending delete jobs not read", error=str(e))
+            return
+        
+        for job_id in job_ids:
+            with self._owned_lock:
+                if job_id in self._owned:
+                    continue
+            try:
+                if not self.store.claim(job_id):
+                    continue
+                job = self.store.get(job_id)
+                # The job may have finished after pending() was read, which
+                # also dropped the lease this replica just took
+                if job is None or job["status"] not in (JOB_PENDING, JOB_RUNNING):
+                    self.store.release(job_id)
+                    continue
+            except Exception as e:
+                self.logger.warning("Delete job not resumed", job_id=job_id, error=str(e))
+                continue
+            
+            self.logger.info("Resuming delete job", job_id=job_id, file_count=len(job["file_ids"]))
+            with self._owned_lock:
+                self._owned.add(job_id)
+            with self._pending_lock:
+                self._pending += 1
+            self._executor.submit(self._run_queued, job_id, job["file_ids"])
@@ -1,10 +1,13 @@
 """Media service implementation with gRPC interface."""
-from typing import Any, Dict, List
+import asyncio
+import tempfile
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import grpc
 from concurrent import futures
 
 from src.generated import media_pb2, media_pb2_grpc
-from src.repository.media_repository import MediaRepository
+from src.repository.media_repository import MediaRepository, UploadReader
+from src.services.delete_worker import DeleteWorker, JOB_COMPLETED, JOB_PENDING
 from src.utils.logger import LoggerMixin
 from src.utils.exceptions import (
     MediaServiceError,
@@ -14,7 +17,21 @@ from src.utils.exceptions import (
     BatchOperationError,
     convert_to_grpc_error,
 )
-from src.config.settings import settings
+from src.utils.file_types import HEADER_SIZE, sniff_file_type
+from src.config.settings import get_settings
+
+settings = get_settings()
+
+# Streamed uploads stay in memory up to this size, then spill to a temporary file
+UPLOAD_SPOOL_SIZE = 4 * 1024 * 1024  # 4MB
+
+# Replies listing more files than this are gzip-compressed; repetitive URLs and
+# timestamps shrink several-fold, while small replies aren't worth the CPU
+COMPRESSION_MIN_FILES = 16
+
+# StreamFiles replies: a generator on the thread-pool servicer, an async
+# generator on the grpc.aio servicer that overrides it
+FileDetailsStream = Union[Iterator[media_pb2.FileDetails], AsyncIterator[media_pb2.FileDetails]]
 
 
 class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
@@ -23,6 +40,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
     def __init__(self):
         """Initialize the media service."""
         self.imagekit_client = MediaRepository()
+        self.delete_worker = DeleteWorker(self.imagekit_client)
         self.logger.info("MediaService initialized")
     
     def GetUploadAuth(
@@ -32,7 +50,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
     ) -> media_pb2.GetUploadAuthResponse:
         """Get upload authentication parameters."""
         try:
-            self.logger.info("Processing GetUploadAuth request")
+            self.sampled_info("Processing GetUploadAuth request")
             auth_params = self.imagekit_client.get_authentication_parameters()
             
             return media_pb2.GetUploadAuthResponse(
@@ -41,14 +59,17 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 signature=auth_params["signature"],
                 public_key=settings.imagekit_public_key,
                 success=True,
-                error_message=""
+                error_message="",
+                upload_url=auth_params["upload_url"],
+                folder=request.folder,
+                tags=request.tags
             )
                     
         except Exception as e:
-            self.logger.error("GetFiles failed", error=str(e))
+            self.logger.error("GetUploadAuth failed", error=str(e))
             context.set_code(convert_to_grpc_error(e))
             context.set_details(str(e))
-            return media_pb2.GetFilesResponse(
+            return media_pb2.GetUploadAuthResponse(
                 success=False,
                 error_message=str(e)
             )
@@ -63,7 +84,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
             if not request.file_id:
                 raise InvalidFileError("File ID is required")
             
-            self.logger.info("Processing DeleteFile request", file_id=request.file_id)
+            self.sampled_info("Processing DeleteFile request", file_id=request.file_id)
             self.imagekit_client.delete_file(request.file_id)
             
             return media_pb2.DeleteFileResponse(
@@ -87,42 +108,127 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
     ) -> media_pb2.DeleteMultipleFilesResponse:
         """Delete multiple files."""
         try:
-            if not request.file_ids:
-                raise InvalidFileError("At least one file ID is required")
+            job_id, job = self._submit_delete_job(request)
+            if request.run_async:
+                return self._delete_job_pending(job_id)
             
-            file_ids = list(request.file_ids)
-            self.logger.info("Processing DeleteMultipleFiles request", file_count=len(file_ids))
+            try:
+                results = job.result(timeout=settings.delete_wait_timeout)
+            except futures.TimeoutError:
+                self.sampled_info("Delete job still running", job_id=job_id)
+                return self._delete_job_pending(job_id)
             
-            results = self.imagekit_client.bulk_delete_files(file_ids)
+            return self._delete_job_completed(job_id, results)
             
-            # Convert to protobuf format
-            delete_results = []
-            all_success = True
-            for result in results:
-                delete_result = media_pb2.DeleteResult(
-                    file_id=result["file_id"],
-                    success=result["success"],
-                    error_message=result["error_message"]
-                )
-                delete_results.append(delete_result)
-                if not result["success"]:
-                    all_success = False
+        except Exception as e:
+            return self._delete_multiple_failed(e, context)
+    
+    def _submit_delete_job(
+        self,
+        request: media_pb2.DeleteMultipleFilesRequest
+    ) -> Tuple[str, futures.Future]:
+        """Validate a DeleteMultipleFiles request and queue its delete job."""
+        if not request.file_ids:
+            raise InvalidFileError("At least one file ID is required")
+        
+        file_ids = list(request.file_ids)
+        self.sampled_info(
+            "Processing DeleteMultipleFiles request",
+            file_count=len(file_ids),
+            run_async=request.run_async
+        )
+        
+        # Deletes run on the delete worker; async callers poll GetDeleteJobStatus
+        return self.delete_worker.submit(file_ids)
+    
+    def _delete_job_pending(self, job_id: str) -> media_pb2.DeleteMultipleFilesResponse:
+        """Reply with the ID of a delete job that is still running."""
+        return media_pb2.DeleteMultipleFilesResponse(
+            job_id=job_id,
+            status=JOB_PENDING,
+            error_message=""
+        )
+    
+    def _delete_job_completed(
+        self,
+        job_id: str,
+        results: List[Dict[str, Any]]
+    ) -> media_pb2.DeleteMultipleFilesResponse:
+        """Reply with the results of a finished delete job."""
+        delete_results, all_success = self._to_delete_results(results)
+        
+        return media_pb2.DeleteMultipleFilesResponse(
+            results=delete_results,
+            all_success=all_success,
+            error_message="" if all_success else "Some files failed to delete",
+            job_id=job_id,
+            status=JOB_COMPLETED
+        )
+    
+    def _delete_multiple_failed(
+        self,
+        error: Exception,
+        context: grpc.ServicerContext
+    ) -> media_pb2.DeleteMultipleFilesResponse:
+        """Report a failed DeleteMultipleFiles call."""
+        self.logger.error("DeleteMultipleFiles failed", error=str(error))
+        context.set_code(convert_to_grpc_error(error))
+        context.set_details(str(error))
+        return media_pb2.DeleteMultipleFilesResponse(
+            all_success=False,
+            error_message=str(error)
+        )
+    
+    def GetDeleteJobStatus(
+        self, 
+        request: media_pb2.GetDeleteJobStatusRequest, 
+        context: grpc.ServicerContext
+    ) -> media_pb2.GetDeleteJobStatusResponse:
+        """Get the status of a queued delete job."""
+        try:
+            if not request.job_id:
+                raise InvalidFileError("Job ID is required")
+            
+            self.sampled_info("Processing GetDeleteJobStatus request", job_id=request.job_id)
+            job = self.delete_worker.get_job(request.job_id)
+            if job is None:
+                raise FileNotFoundError(f"Delete job not found: {request.job_id}")
+            
+            delete_results, all_success = self._to_delete_results(job["results"])
             
-            return media_pb2.DeleteMultipleFilesResponse(
+            return media_pb2.GetDeleteJobStatusResponse(
+                job_id=request.job_id,
+                status=job["status"],
                 results=delete_results,
-                all_success=all_success,
-                error_message="" if all_success else "Some files failed to delete"
+                all_success=job["status"] == JOB_COMPLETED and all_success,
+                success=True,
+                error_message=job["error_message"]
             )
             
         except Exception as e:
-            self.logger.error("DeleteMultipleFiles failed", error=str(e))
+            self.logger.error("GetDeleteJobStatus failed", error=str(e), job_id=request.job_id)
             context.set_code(convert_to_grpc_error(e))
             context.set_details(str(e))
-            return media_pb2.DeleteMultipleFilesResponse(
-                all_success=False,
+            return media_pb2.GetDeleteJobStatusResponse(
+                success=False,
                 error_message=str(e)
             )
     
+    def _to_delete_results(self, results: List[Dict[str, Any]]):
+        """Convert delete result dictionaries to DeleteResult messages."""
+        delete_results = []
+        all_success = True
+        for result in results:
+            delete_result = media_pb2.DeleteResult(
+                file_id=result["file_id"],
+                success=result["success"],
+                error_message=result["error_message"]
+            )
+            delete_results.append(delete_result)
+            if not result["success"]:
+                all_success = False
+        return delete_results, all_success
+    
     def UploadFile(
         self, 
         request: media_pb2.UploadFileRequest, 
@@ -134,8 +240,13 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 raise InvalidFileError("File data is required")
             if not request.filename:
                 raise InvalidFileError("Filename is required")
+            if len(request.file_data) > settings.max_server_upload_mb * 1024 * 1024:
+                raise FileSizeExceededError(
+                    f"Files over {settings.max_server_upload_mb}MB must be uploaded with "
+                    "UploadFileStream or directly using GetUploadAuth and CommitUpload"
+                )
             
-            self.logger.info(
+            self.sampled_info(
                 "Processing UploadFile request",
                 filename=request.filename,
                 folder=request.folder or None,
@@ -152,7 +263,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
             )
             
             return media_pb2.UploadFileResponse(
-                file=self._dict_to_file_details(file_details),
+                file=file_details,
                 success=True,
                 error_message=""
             )
@@ -166,6 +277,132 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 error_message=str(e)
             )
     
+    def UploadFileStream(
+        self, 
+        request_iterator: Iterable[media_pb2.UploadFileChunk], 
+        context: grpc.ServicerContext
+    ) -> media_pb2.UploadFileResponse:
+        """Upload a file streamed as a metadata message followed by data chunks."""
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE) as spool:
+            metadata = None
+            try:
+                for message in request_iterator:
+                    metadata = self._spool_upload_chunk(spool, metadata, message)
+                return self._upload_spooled_file(spool, metadata)
+            except Exception as e:
+                return self._upload_stream_failed(e, metadata, context)
+    
+    def _spool_upload_chunk(
+        self,
+        spool: tempfile.SpooledTemporaryFile,
+        metadata: Optional[media_pb2.UploadFileMetadata],
+        message: media_pb2.UploadFileChunk
+    ) -> media_pb2.UploadFileMetadata:
+        """Record the upload metadata or append a data chunk to the spool."""
+        if message.WhichOneof("data") == "metadata":
+            if metadata is not None:
+                raise InvalidFileError("Upload metadata must only be sent once")
+            return message.metadata
+        
+        if metadata is None:
+            raise InvalidFileError("Upload metadata must be sent before any data")
+        # Abort on the first chunk rather than after receiving the whole file
+        if (
+            settings.validate_file_types
+            and spool.tell() == 0
+            and len(message.chunk) >= HEADER_SIZE
+            and sniff_file_type(message.chunk[:HEADER_SIZE]) is None
+        ):
+            raise InvalidFileError(f"Unsupported or unrecognised file content: {metadata.filename}")
+        spool.write(message.chunk)
+        if spool.tell() > settings.max_file_size_mb * 1024 * 1024:
+            raise FileSizeExceededError(
+                f"File size exceeds limit of {settings.max_file_size_mb}MB"
+            )
+        return metadata
+    
+    def _upload_spooled_file(
+        self,
+        spool: tempfile.SpooledTemporaryFile,
+        metadata: Optional[media_pb2.UploadFileMetadata]
+    ) -> media_pb2.UploadFileResponse:
+        """Upload a fully received stream to ImageKit."""
+        if metadata is None or not metadata.filename:
+            raise InvalidFileError("Filename is required")
+        file_size = spool.tell()
+        if not file_size:
+            raise InvalidFileError("File data is required")
+        
+        self.sampled_info(
+            "Processing UploadFileStream request",
+            filename=metadata.filename,
+            size=file_size,
+            folder=metadata.folder or None,
+            tags=list(metadata.tags) if metadata.tags else None
+        )
+        
+        spool.seek(0)
+        file_details = self.imagekit_client.upload_file(
+            file_data=UploadReader(spool, file_size),
+            filename=metadata.filename,
+            folder=metadata.folder or None,
+            tags=list(metadata.tags) if metadata.tags else None,
+            use_unique_filename=metadata.use_unique_filename,
+            custom_coordinates=metadata.custom_coordinates or None,
+        )
+        
+        return media_pb2.UploadFileResponse(
+            file=file_details,
+            success=True,
+            error_message=""
+        )
+    
+    def _upload_stream_failed(
+        self,
+        error: Exception,
+        metadata: Optional[media_pb2.UploadFileMetadata],
+        context: grpc.ServicerContext
+    ) -> media_pb2.UploadFileResponse:
+        """Report a failed streamed upload."""
+        filename = metadata.filename if metadata is not None else None
+        self.logger.error("UploadFileStream failed", error=str(error), filename=filename)
+        context.set_code(convert_to_grpc_error(error))
+        context.set_details(str(error))
+        return media_pb2.UploadFileResponse(
+            success=False,
+            error_message=str(error)
+        )
+    
+    def CommitUpload(
+        self, 
+        request: media_pb2.CommitUploadRequest, 
+        context: grpc.ServicerContext
+    ) -> media_pb2.CommitUploadResponse:
+        """Confirm a client-direct upload and return its file details."""
+        try:
+            if not request.file_id:
+                raise InvalidFileError("File ID is required")
+            
+            self.sampled_info("Processing CommitUpload request", file_id=request.file_id)
+            # The file was uploaded around the service, so cached listings are stale
+            self.imagekit_client.invalidate_file(request.file_id)
+            file_details = self.imagekit_client.get_file_details(request.file_id)
+            
+            return media_pb2.CommitUploadResponse(
+                file=file_details,
+                success=True,
+                error_message=""
+            )
+            
+        except Exception as e:
+            self.logger.error("CommitUpload failed", error=str(e), file_id=request.file_id)
+            context.set_code(convert_to_grpc_error(e))
+            context.set_details(str(e))
+            return media_pb2.CommitUploadResponse(
+                success=False,
+                error_message=str(e)
+            )
+    
     def UpdateFileDetails(
         self, 
         request: media_pb2.UpdateFileDetailsRequest, 
@@ -176,7 +413,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
             if not request.file_id:
                 raise InvalidFileError("File ID is required")
             
-            self.logger.info(
+            self.sampled_info(
                 "Processing UpdateFileDetails request",
                 file_id=request.file_id,
                 tags=list(request.tags) if request.tags else None
@@ -190,7 +427,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
             )
             
             return media_pb2.UpdateFileDetailsResponse(
-                file=self._dict_to_file_details(file_details),
+                file=file_details,
                 success=True,
                 error_message=""
             )
@@ -204,24 +441,6 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 error_message=str(e)
             )
     
-    def _dict_to_file_details(self, file_dict: Dict[str, Any]) -> media_pb2.FileDetails:
-        """Convert dictionary to FileDetails protobuf message."""
-        return media_pb2.FileDetails(
-            file_id=file_dict.get("file_id", ""),
-            name=file_dict.get("name", ""),
-            url=file_dict.get("url", ""),
-            thumbnail_url=file_dict.get("thumbnail_url", ""),
-            size=file_dict.get("size", 0),
-            file_type=file_dict.get("file_type", ""),
-            tags=file_dict.get("tags", []),
-            folder_path=file_dict.get("folder_path", ""),
-            created_at=file_dict.get("created_at", ""),
-            updated_at=file_dict.get("updated_at", ""),
-            width=file_dict.get("width", 0),
-            height=file_dict.get("height", 0),
-            custom_metadata=file_dict.get("custom_metadata", {}),
-        )
-
     def GetFileDetails(
         self, 
         request: media_pb2.GetFileDetailsRequest, 
@@ -232,11 +451,11 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
             if not request.file_id:
                 raise InvalidFileError("File ID is required")
             
-            self.logger.info("Processing GetFileDetails request", file_id=request.file_id)
+            self.sampled_info("Processing GetFileDetails request", file_id=request.file_id)
             file_details = self.imagekit_client.get_file_details(request.file_id)
             
             return media_pb2.GetFileDetailsResponse(
-                file=self._dict_to_file_details(file_details),
+                file=file_details,
                 success=True,
                 error_message=""
             )
@@ -250,6 +469,37 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 error_message=str(e)
             )
     
+    def GetFileDetailsBatch(
+        self, 
+        request: media_pb2.GetFileDetailsBatchRequest, 
+        context: grpc.ServicerContext
+    ) -> media_pb2.GetFileDetailsBatchResponse:
+        """Get details of several files in one call."""
+        try:
+            if not request.file_ids:
+                raise InvalidFileError("At least one file ID is required")
+            
+            self.sampled_info("Processing GetFileDetailsBatch request", file_count=len(request.file_ids))
+            files, errors = self.imagekit_client.get_file_details_batch(list(request.file_ids))
+            if len(files) > COMPRESSION_MIN_FILES:
+                context.set_compression(grpc.Compression.Gzip)
+            
+            return media_pb2.GetFileDetailsBatchResponse(
+                files=files,
+                errors=errors,
+                success=True,
+                error_message=""
+            )
+            
+        except Exception as e:
+            self.logger.error("GetFileDetailsBatch failed", error=str(e))
+            context.set_code(convert_to_grpc_error(e))
+            context.set_details(str(e))
+            return media_pb2.GetFileDetailsBatchResponse(
+                success=False,
+                error_message=str(e)
+            )
+    
     def GetFiles(
         self, 
         request: media_pb2.GetFilesRequest, 
@@ -257,7 +507,7 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
     ) -> media_pb2.GetFilesResponse:
         """Get list of files with optional filters."""
         try:
-            self.logger.info(
+            self.sampled_info(
                 "Processing GetFiles request",
                 skip=request.skip,
                 limit=request.limit,
@@ -266,30 +516,8 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 file_type=request.file_type or None
             )
             
-            # Validate parameters
-            if request.limit <= 0:
-                request.limit = 1000
-            if request.skip < 0:
-                request.skip = 0
-            
-            result = self.imagekit_client.list_files(
-                skip=request.skip,
-                limit=request.limit,
-                search_query=request.search_query or None,
-                tags=list(request.tags) if request.tags else None,
-                file_type=request.file_type or None,
-                sort=request.sort or None,
-                path=request.path or None,
-            )
-            
-            files = [self._dict_to_file_details(file_dict) for file_dict in result["files"]]
-            
-            return media_pb2.GetFilesResponse(
-                files=files,
-                success=True,
-                error_message="",
-                total_count=result.get("total_count", len(files))
-            )
+            result = self.imagekit_client.list_files(**self._list_files_params(request))
+            return self._files_response(result, context)
         except Exception as e:
             self.logger.error("GetFiles failed", error=str(e))
             context.set_code(convert_to_grpc_error(e))
@@ -299,4 +527,191 @@ class MediaServiceImpl(media_pb2_grpc.MediaServiceServicer, LoggerMixin):
                 error_message=str(e),
                 total_count=0,
                 files=[]
-            )
\ No newline at end of file
+            )
+    
+    def StreamFiles(
+        self, 
+        request: media_pb2.GetFilesRequest, 
+        context: grpc.ServicerContext
+    ) -> FileDetailsStream:
+        """Stream files matching the filters page by page."""
+        return self._stream_files(request, context)
+    
+    def _stream_files(
+        self,
+        request: media_pb2.GetFilesRequest,
+        context: grpc.ServicerContext
+    ) -> Iterator[media_pb2.FileDetails]:
+        """Yield files matching the filters, fetching pages on the calling thread."""
+        try:
+            self.sampled_info("Processing StreamFiles request", skip=request.skip, limit=request.limit)
+            for files in self.imagekit_client.iter_file_pages(**self._list_files_params(request)):
+                yield from files
+        except Exception as e:
+            self._stream_files_failed(e, context)
+    
+    def _stream_files_failed(self, error: Exception, context: grpc.ServicerContext) -> None:
+        """Report a failed file stream; files already sent stay with the client."""
+        self.logger.error("StreamFiles failed", error=str(error))
+        context.set_code(convert_to_grpc_error(error))
+        context.set_details(str(error))
+    
+    def _list_files_params(self, request: media_pb2.GetFilesRequest) -> Dict[str, Any]:
+        """Validate a GetFiles request and turn it into ``list_files`` arguments."""
+        return {
+            "skip": max(request.skip, 0),
+            "limit": request.limit if request.limit > 0 else 1000,
+            "search_query": request.search_query or None,
+            "tags": list(request.tags) if request.tags else None,
+            "file_type": request.file_type or None,
+            "sort": request.sort or None,
+            "path": request.path or None,
+        }
+    
+    def _files_response(
+        self,
+        result: Dict[str, Any],
+        context: grpc.ServicerContext
+    ) -> media_pb2.GetFilesResponse:
+        """Build a GetFiles reply from a ``list_files`` result."""
+        files = result["files"]
+        if len(files) > COMPRESSION_MIN_FILES:
+            context.set_compression(grpc.Compression.Gzip)
+        
+        # Cached results are shared, so the reply is built once per cached
+        # page and later hits return it without copying every FileDetails
+        response = result.get("response")
+        if response is None:
+            response = result["response"] = media_pb2.GetFilesResponse(
+                files=files,
+                success=True,
+                error_message="",
+                total_count=result.get("total_count", len(files))
+            )
+        return response
+
+
+class AsyncMediaServiceImpl(MediaServiceImpl):
+    """asyncio implementation of the MediaService gRPC interface for grpc.aio servers.
+    
+    The ImageKit SDK is blocking, so each RPC runs the synchronous implementation
+    on a dedicated executor and the event loop stays free to serve other calls.
+    """
+    
+    def __init__(self, executor: Optional[futures.Executor] = None):
+        """Initialize the media service with the executor used for blocking calls."""
+        super().__init__()
+        self.executor = executor
+    
+    async def _run_blocking(self, method: Callable, request: Any, context: grpc.aio.ServicerContext) -> Any:
+        """Run a synchronous RPC implementation off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, method, request, context)
+    
+    async def GetUploadAuth(self, request, context):
+        """Get upload authentication parameters."""
+        # Signing is local and cheap, so it runs on the event loop
+        return super().GetUploadAuth(request, context)
+    
+    async def GetFileDetails(self, request, context):
+        """Get details of a specific file."""
+        if request.file_id:
+            # Cache hits are answered on the event loop without an executor hop
+            file_details = self.imagekit_client.cached_file_details(request.file_id)
+            if file_details is not None:
+                return media_pb2.GetFileDetailsResponse(
+                    file=file_details,
+                    success=True,
+                    error_message=""
+                )
+        return await self._run_blocking(super().GetFileDetails, request, context)
+    
+    async def GetFileDetailsBatch(self, request, context):
+        """Get details of several files in one call."""
+        return await self._run_blocking(super().GetFileDetailsBatch, request, context)
+    
+    async def GetFiles(self, request, context):
+        """Get list of files with optional filters."""
+        result = self.imagekit_client.cached_files(**self._list_files_params(request))
+        if result is not None:
+            return self._files_response(result, context)
+        return await self._run_blocking(super().GetFiles, request, context)
+    
+    async def StreamFiles(self, request, context) -> AsyncIterator[media_pb2.FileDetails]:
+        """Stream files matching the filters page by page."""
+        loop = asyncio.get_running_loop()
+        try:
+            self.sampled_info("Processing StreamFiles request", skip=request.skip, limit=request.limit)
+            pages = self.imagekit_client.iter_file_pages(**self._list_files_params(request))
+            # Only waiting for a page needs a thread; items are sent from the loop
+            while True:
+                files = await loop.run_in_executor(self.executor, next, pages, None)
+                if files is None:
+                    break
+                for file_details in files:
+                    yield file_details
+        except Exception as e:
+            self._stream_files_failed(e, context)
+    
+    async def DeleteFile(self, request, context):
+        """Delete a single file."""
+        return await self._run_blocking(super().DeleteFile, request, context)
+    
+    async def DeleteMultipleFiles(self, request, context):
+        """Delete multiple files."""
+        loop = asyncio.get_running_loop()
+        try:
+            job_id, job = await loop.run_in_executor(self.executor, self._submit_delete_job, request)
+            if request.run_async:
+                return self._delete_job_pending(job_id)
+            
+            # Wait on the loop so no executor thread is held for the job;
+            # shielded so a timeout leaves the job running
+            try:
+                results = await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(job)), settings.delete_wait_timeout
+                )
+            except asyncio.TimeoutError:
+                self.sampled_info("Delete job still running", job_id=job_id)
+                return self._delete_job_pending(job_id)
+            
+            return self._delete_job_completed(job_id, results)
+            
+        except Exception as e:
+            return self._delete_multiple_failed(e, context)
+    
+    async def GetDeleteJobStatus(self, request, context):
+        """Get the status of a queued delete job."""
+        return await self._run_blocking(super().GetDeleteJobStatus, request, context)
+    
+    async def UploadFile(self, request, context):
+        """Upload a file."""
+        return await self._run_blocking(super().UploadFile, request, context)
+    
+    async def UploadFileStream(self, request_iterator, context):
+        """Upload a file streamed as a metadata message followed by data chunks."""
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE) as spool:
+            metadata = None
+            loop = asyncio.get_running_loop()
+            try:
+                async for message in request_iterator:
+                    # Writes past the in-memory size go to disk, so they run off the loop
+                    if spool.tell() + len(message.chunk) > UPLOAD_SPOOL_SIZE:
+                        metadata = await loop.run_in_executor(
+                            self.executor, self._spool_upload_chunk, spool, metadata, message
+                        )
+                    else:
+                        metadata = self._spool_upload_chunk(spool, metadata, message)
+                return await loop.run_in_executor(
+                    self.executor, self._upload_spooled_file, spool, metadata
+                )
+            except Exception as e:
+                return self._upload_stream_failed(e, metadata, context)
+    
+    async def CommitUpload(self, request, context):
+        """Confirm a client-direct upload and return its file details."""
+        return await self._run_blocking(super().CommitUpload, request, context)
+    
+    async def UpdateFileDetails(self, request, context):
+        """Update file details."""
+        return await self._run_blocking(super().UpdateFileDetails, request, context)
\ No newline at end of file
@@ -1,5 +1,5 @@
 """Custom exceptions for the media service."""
-from typing import Optional
+from typing import Dict, Optional
 import grpc
 
 
@@ -40,17 +40,27 @@ class BatchOperationError(MediaServiceError):
         self.failed_items = failed_items or []
 
 
+# gRPC status reported for each media service exception
+_STATUS_CODES: Dict[type, grpc.StatusCode] = {
+    FileNotFoundError: grpc.StatusCode.NOT_FOUND,
+    InvalidFileError: grpc.StatusCode.INVALID_ARGUMENT,
+    FileSizeExceededError: grpc.StatusCode.RESOURCE_EXHAUSTED,
+    ImageKitError: grpc.StatusCode.UNAVAILABLE,
+    BatchOperationError: grpc.StatusCode.FAILED_PRECONDITION,
+}
+
+# Status resolved for every exception type seen so far, including subclasses
+_resolved_status_codes: Dict[type, grpc.StatusCode] = dict(_STATUS_CODES)
+
+
 def convert_to_grpc_error(error: Exception) -> grpc.StatusCode:
     """Convert Python exceptions to gRPC status codes."""
-    if isinstance(error, FileNotFoundError):
-        return grpc.StatusCode.NOT_FOUND
-    elif isinstance(error, InvalidFileError):
-        return grpc.StatusCode.INVALID_ARGUMENT
-    elif isinstance(error, FileSizeExceededError):
-        return grpc.StatusCode.RESOURCE_EXHAUSTED
-    elif isinstance(error, ImageKitError):
-        return grpc.StatusCode.EXTERNAL
-    elif isinstance(error, BatchOperationError):
-        return grpc.StatusCode.FAILED_PRECONDITION
-    else:
-        return grpc.StatusCode.INTERNAL
\ No newline at end of file
+    error_type = type(error)
+    code = _resolved_status_codes.get(error_type)
+    if code is None:
+        code = next(
+            (_STATUS_CODES[cls] for cls in error_type.__mro__ if cls in _STATUS_CODES),
+            grpc.StatusCode.INTERNAL
+        )
+        _resolved_status_codes[error_type] = code
+    return code
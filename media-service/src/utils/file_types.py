@@ -0,0 +1,82 @@
+"""Cheap content-type detection from a file's leading bytes."""
+from typing import Optional
+
+# Bytes of a file needed to recognise any of the types below; SVG roots may
+# follow an XML declaration, a doctype and editor comments
+HEADER_SIZE = 1024
+
+# Leading bytes of the file types accepted for upload
+MAGIC_NUMBERS = {
+    b"\xff\xd8\xff": "jpeg",
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+    b"BM": "bmp",
+    b"II*\x00": "tiff",
+    b"MM\x00*": "tiff",
+    b"\x00\x00\x01\x00": "ico",
+    b"8BPS": "psd",
+    b"\x00\x00\x00\x0cjP  \r\n\x87\n": "jp2",
+    b"\x00\x00\x00\x0cJXL \r\n\x87\n": "jxl",
+    b"\xff\x0a": "jxl",
+    b"%PDF-": "pdf",
+    b"%!PS": "eps",
+    b"\xc5\xd0\xd3\xc6": "eps",
+    b"\x1aE\xdf\xa3": "webm",
+    b"FLV": "flv",
+    b"0&\xb2u\x8ef\xcf\x11": "wmv",
+    b"\x00\x00\x01\xba": "mpeg",
+    b"\x00\x00\x01\xb3": "mpeg",
+    b"OggS": "ogg",
+    b"ID3": "mp3",
+    # MPEG audio frame sync: MPEG-1/2 layer III with and without CRC
+    b"\xff\xfb": "mp3",
+    b"\xff\xfa": "mp3",
+    b"\xff\xf3": "mp3",
+    b"\xff\xf2": "mp3",
+    # AAC ADTS frames, MPEG-4 and MPEG-2, with and without CRC
+    b"\xff\xf1": "aac",
+    b"\xff\xf0": "aac",
+    b"\xff\xf9": "aac",
+    b"\xff\xf8": "aac",
+    b"ADIF": "aac",
+    b"fLaC": "flac",
+}
+
+# RIFF containers carry their format at bytes 8-12
+RIFF_FORMATS = {
+    b"WEBP": "webp",
+    b"AVI ": "avi",
+    b"WAVE": "wav",
+}
+
+# ISO base media files (MP4, MOV, HEIC, AVIF) have an ``ftyp`` box at byte 4
+FTYP_BRANDS = {
+    b"avif": "avif",
+    b"avis": "avif",
+    b"heic": "heic",
+    b"heix": "heic",
+    b"mif1": "heic",
+    b"qt  ": "mov",
+}
+
+# Markup an SVG document may open with before its ``<svg`` root element
+SVG_PREFIXES = (b"<svg", b"<?xml", b"<!doctype", b"<!--")
+
+
+def sniff_file_type(header: bytes) -> Optional[str]:
+    """Return the file type recognised from leading bytes, or None if unknown."""
+    if header[:4] == b"RIFF":
+        return RIFF_FORMATS.get(header[8:12])
+    if header[4:8] == b"ftyp":
+        return FTYP_BRANDS.get(header[8:12], "mp4")
+    for magic, file_type in MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return file_type
+
+    # Text formats may start with a byte order mark or whitespace; other XML
+    # is only accepted when it has an SVG root
+    markup = header.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if markup.startswith(SVG_PREFIXES) and b"<svg" in markup:
+        return "svg"
+    return None
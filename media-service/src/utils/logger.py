@@ -1,16 +1,25 @@
 """Logging configuration for the media service."""
 import logging
+import random
 import sys
 from typing import Any, Dict
+import orjson
 import structlog
 from colorama import init as colorama_init
 
-from src.config.settings import settings
+from src.config.settings import get_settings
+
+settings = get_settings()
 
 # Initialize colorama for Windows compatibility
 colorama_init()
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for the stdlib logging handlers."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def configure_logging() -> None:
     """Configure structured logging for the application."""
     
@@ -34,7 +43,7 @@ def configure_logging() -> None:
     ]
     
     if settings.log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.extend([
             structlog.dev.ConsoleRenderer(colors=True),
@@ -59,4 +68,13 @@ class LoggerMixin:
     @property
     def logger(self) -> structlog.BoundLogger:
         """Get logger instance for this class."""
-        return get_logger(self.__class__.__name__)
\ No newline at end of file
+        return get_logger(self.__class__.__name__)
+    
+    def sampled_info(self, event: str, **kwargs: Any) -> None:
+        """Log a routine success-path event for a ``LOG_SAMPLE_RATE`` fraction of calls.
+        
+        Warnings and errors should keep using ``self.logger`` so they are never dropped.
+        """
+        sample_rate = settings.log_sample_rate
+        if sample_rate >= 1.0 or random.random() < sample_rate:
+            self.logger.info(event, sample_rate=sample_rate, **kwargs)
\ No newline at end of file